@@ -1,6 +1,9 @@
-from .dash import Dash  # noqa: F401
+from .dash import Dash, no_update  # noqa: F401
+from ._json import RawJSON  # noqa: F401
 from . import dependencies  # noqa: F401
 from . import development  # noqa: F401
 from . import exceptions  # noqa: F401
 from . import resources  # noqa: F401
+from . import caching  # noqa: F401
+from . import lazy  # noqa: F401
 from .version import __version__  # noqa: F401
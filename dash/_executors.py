@@ -0,0 +1,372 @@
+import collections
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import uuid
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import caching
+from . import exceptions
+
+try:
+    import asyncio
+except ImportError:  # Python 2
+    asyncio = None
+
+
+def is_coroutine_function(func):
+    return asyncio is not None and asyncio.iscoroutinefunction(func)
+
+
+# pylint: disable=too-few-public-methods
+class EventLoopThread(object):
+    """
+    An asyncio event loop running in a daemon thread.
+
+    The coroutine callbacks of every request are scheduled on the same loop,
+    the awaiting requests only hold their own thread while the I/O of all the
+    callbacks is multiplexed by the loop.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self):
+        with self._lock:
+            # The thread of the loop doesn't survive a fork.
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                thread = threading.Thread(target=self._loop.run_forever)
+                thread.daemon = True
+                thread.start()
+            return self._loop
+
+    def run(self, coroutine):
+        """Run `coroutine` on the loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(
+            coroutine, self._get_loop()).result()
+
+
+class _Job(object):
+    # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.status = 'pending'
+        self.progress = None
+        self.result = None
+        self.finished = None
+        self.future = None
+
+
+# pylint: disable=too-many-instance-attributes
+class JobManager(object):
+    """
+    Runs the background callbacks in a thread pool.
+
+    The results of the finished jobs are kept for `retention` seconds and
+    at most `max_finished` of them are kept.
+    """
+
+    def __init__(self, max_workers=4, retention=300, max_finished=256,
+                 logger=None):
+        self.max_workers = max_workers
+        self.logger = logger
+        self.retention = retention
+        self.max_finished = max_finished
+        self._jobs = {}
+        self._finished = collections.OrderedDict()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+
+    def _get_pool(self):
+        if self._pool is None or self._pid != os.getpid():
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._pid = os.getpid()
+        return self._pool
+
+    def submit(self, func, *args):
+        """Run `func(*args)` in the pool and return the id of the job."""
+        job_id = uuid.uuid4().hex
+        job = _Job()
+
+        def run():
+            with self._lock:
+                cancelled = job.status == 'cancelled'
+                job.status = 'cancelled' if cancelled else 'running'
+            if cancelled:
+                self._finish(job_id, job, None, 'cancelled')
+                return
+
+            self._local.job = job
+            try:
+                result, status = func(*args), 'done'
+            except exceptions.PreventUpdate:
+                result, status = None, 'prevented'
+            except exceptions.CallbackCancelled:
+                result, status = None, 'cancelled'
+            except Exception:  # pylint: disable=broad-except
+                result, status = None, 'error'
+                if self.logger is not None:
+                    self.logger.exception('Background callback failed')
+            finally:
+                self._local.job = None
+            self._finish(job_id, job, result, status)
+
+        with self._lock:
+            self._prune()
+            self._jobs[job_id] = job
+            job.future = self._get_pool().submit(run)
+        return job_id
+
+    def _finish(self, job_id, job, result, status):
+        with self._lock:
+            if job.status != 'cancelled':
+                job.status = status
+                job.result = result
+            job.finished = time.time()
+            self._finished[job_id] = job
+            self._prune()
+
+    def _prune(self):
+        expired = time.time() - self.retention
+        while self._finished:
+            job_id, job = next(iter(self._finished.items()))
+            if (len(self._finished) <= self.max_finished and
+                    job.finished >= expired):
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
+
+    def get(self, job_id):
+        """The job with the given id or `None` if it's unknown or expired."""
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job, a running job is only interrupted if it reports its
+        progress.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished is not None:
+                return job
+            job.status = 'cancelled'
+            if job.future.cancel():
+                job.finished = time.time()
+                self._finished[job_id] = job
+            return job
+
+    def set_progress(self, progress):
+        job = getattr(self._local, 'job', None)
+        if job is None:
+            raise exceptions.CallbackException(
+                '`set_progress` can only be called from a background '
+                'callback.')
+        if job.status == 'cancelled':
+            raise exceptions.CallbackCancelled(
+                'The background callback was cancelled.')
+        job.progress = progress
+
+
+# The functions run by the process pools, by key. The workers are forked
+# after the registration so the functions don't have to be pickled.
+_process_functions = {}
+
+
+def _run_registered(key, args):
+    return _process_functions[key](*args)
+
+
+def _warm_up():
+    return os.getpid()
+
+
+def _fork_pool_kwargs():
+    """
+    The arguments of `ProcessPoolExecutor` forking its workers, `None` when
+    the workers can't be forked.
+    """
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:  # Python 2 forks the workers on POSIX.
+        return {} if os.name == 'posix' else None
+    except ValueError:  # Windows
+        return None
+    if sys.version_info >= (3, 7):
+        return {'mp_context': context}
+    # Python 3.6, not reached on Python 2.
+    # pylint: disable=no-member
+    start_method = multiprocessing.get_start_method(allow_none=True)
+    if start_method in (None, 'fork'):
+        return {}
+    return None
+
+
+class ProcessPool(object):
+    """
+    A warm `ProcessPoolExecutor` for the CPU bound callbacks.
+
+    The workers are started when the pool is first used or by `warm_up` and
+    a new pool is created in the children of a fork. Only the arguments and
+    the return value of the registered functions cross the process boundary.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def register(self, func):
+        """Register `func` to be run in the workers, return its key."""
+        if _fork_pool_kwargs() is None:
+            raise exceptions.IncorrectTypeException(
+                'The `\'process\'` executor forks its workers, which isn\'t '
+                'supported with the multiprocessing start method of this '
+                'platform.')
+        key = uuid.uuid4().hex
+        _process_functions[key] = func
+        with self._lock:
+            # The running workers were forked without this function.
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.shutdown(wait=False)
+            self._pool = None
+        return key
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    **(_fork_pool_kwargs() or {}))
+                self._pid = os.getpid()
+                futures = [
+                    self._pool.submit(_warm_up)
+                    for _ in range(self.max_workers)
+                ]
+                for future in futures:
+                    future.result()
+            return self._pool
+
+    def warm_up(self):
+        self._get_pool()
+
+    def run(self, key, *args):
+        """Run the function registered with `key` in a worker."""
+        return self._get_pool().submit(_run_registered, key, args).result()
+
+
+class _Tick(object):
+    # pylint: disable=too-few-public-methods
+    def __init__(self, func, interval, args):
+        self.func = func
+        self.interval = interval
+        self.args = args
+        self.result = None
+        self.computed = None
+        self.requested = None
+        self.active = False
+        self.lock = threading.Lock()
+
+
+class TickScheduler(object):
+    """
+    Computes the shared callbacks once per tick in a daemon thread.
+
+    Each distinct tuple of arguments of a callback has its own tick, the
+    requests are answered with the response of the current tick of their
+    arguments. A tick stops after `idle_ticks` ticks without a request and
+    is dropped, the next request with the same arguments starts a new one.
+    """
+
+    def __init__(self, idle_ticks=3, logger=None):
+        self.idle_ticks = idle_ticks
+        self.logger = logger
+        self._callbacks = {}
+        self._ticks = {}
+        self._condition = threading.Condition()
+        self._pid = None
+
+    def register(self, key, func, interval):
+        self._callbacks[key] = (func, interval)
+
+    def get(self, key, *args):
+        """The response of the current tick of the callback `key`."""
+        func, interval = self._callbacks[key]
+        tick_key = caching.callback_key(key, args)
+        with self._condition:
+            now = time.time()
+            tick = self._ticks.get(tick_key)
+            if tick is None:
+                tick = self._ticks[tick_key] = _Tick(func, interval, args)
+            tick.requested = now
+
+        with tick.lock:
+            if tick.computed is None or (
+                    not tick.active and now - tick.computed >= tick.interval):
+                tick.result = tick.func(*args)
+                tick.computed = time.time()
+            result = tick.result
+
+        if not tick.active:
+            with self._condition:
+                tick.active = True
+                self._start()
+                self._condition.notify()
+        return result
+
+    def _start(self):
+        # The thread of the scheduler doesn't survive a fork.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            thread = threading.Thread(target=self._run)
+            thread.daemon = True
+            thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                now = time.time()
+                due = []
+                wait = None
+                for tick_key, tick in list(self._ticks.items()):
+                    if not tick.active:
+                        continue
+                    delay = tick.computed + tick.interval - now
+                    if delay > 0:
+                        if wait is None or delay < wait:
+                            wait = delay
+                    elif (now - tick.requested >
+                          tick.interval * self.idle_ticks):
+                        # Checked with the lock held, a request can't
+                        # pick up the tick while it's dropped.
+                        del self._ticks[tick_key]
+                    else:
+                        due.append(tick)
+                if not due:
+                    self._condition.wait(wait)
+                    continue
+
+            for tick in due:
+                self._tick(tick)
+
+    def _tick(self, tick):
+        with tick.lock:
+            try:
+                tick.result = tick.func(*tick.args)
+            except exceptions.PreventUpdate:
+                tick.result = None
+            except Exception:  # pylint: disable=broad-except
+                # Keep serving the response of the previous tick.
+                if self.logger is not None:
+                    self.logger.exception('Shared callback failed')
+            tick.computed = time.time()
@@ -0,0 +1,188 @@
+import json
+import math
+import re
+import sys
+import uuid
+
+import plotly
+import six
+
+from . import exceptions
+from .development.base_component import Component
+
+
+# pylint: disable=too-few-public-methods
+class RawJSON(object):
+    """
+    A value already encoded to JSON, spliced as is in the layouts and the
+    callback responses instead of being encoded again, e.g. for the large
+    static figures and datasets.
+
+    :param text: The JSON, a string or utf-8 bytes. It's not validated.
+    """
+
+    def __init__(self, text):
+        self.text = text.decode('utf-8') if isinstance(text, bytes) else text
+
+    @classmethod
+    def from_object(cls, obj):
+        """Encode `obj` once with `PlotlyJSONEncoder`."""
+        return cls(PlotlyJSONEngine().dumps(obj))
+
+    def __repr__(self):
+        return 'RawJSON({})'.format(self.text[:60])
+
+
+class _PlotlyJSONEncoder(plotly.utils.PlotlyJSONEncoder):
+    # The `RawJSON` are encoded as placeholders replaced by `splice`.
+
+    def __init__(self, *args, **kwargs):
+        super(_PlotlyJSONEncoder, self).__init__(*args, **kwargs)
+        self.raw = []
+        self.nonce = None
+
+    def default(self, obj):  # pylint: disable=method-hidden
+        if isinstance(obj, RawJSON):
+            if self.nonce is None:
+                self.nonce = uuid.uuid4().hex
+            self.raw.append(obj.text)
+            return '__dash_raw_json_{}_{}__'.format(
+                self.nonce, len(self.raw) - 1)
+        return super(_PlotlyJSONEncoder, self).default(obj)
+
+    def splice(self, encoded):
+        if not self.raw:
+            return encoded
+        return re.sub(
+            '"__dash_raw_json_{}_([0-9]+)__"'.format(self.nonce),
+            lambda match: self.raw[int(match.group(1))],
+            encoded)
+
+
+def _dumps(obj, cls, **kwargs):
+    encoder = cls(**kwargs)
+    return encoder.splice(encoder.encode(obj))
+
+
+class PlotlyJSONEngine(object):
+    """Serialize with `plotly.utils.PlotlyJSONEncoder`."""
+
+    # pylint: disable=no-self-use
+    def dumps(self, obj):
+        return _dumps(obj, _PlotlyJSONEncoder)
+
+
+class _FastJSONEncoder(_PlotlyJSONEncoder):
+    def encode(self, o):
+        # Skip the strict JSON round trip of `PlotlyJSONEncoder`, the
+        # engine falls back to it when a NaN or an Infinity is found.
+        return json.JSONEncoder.encode(self, o)
+
+    def default(self, obj):  # pylint: disable=method-hidden
+        if isinstance(obj, Component):
+            return obj.to_plotly_json()
+
+        # Only look for the types of the libraries already imported.
+        obj_type = type(obj)
+        numpy = sys.modules.get('numpy')
+        if numpy is not None and obj_type is numpy.ndarray:
+            return obj.tolist()
+        pandas = sys.modules.get('pandas')
+        if pandas is not None and obj_type is pandas.Series:
+            return obj.tolist()
+
+        return super(_FastJSONEncoder, self).default(obj)
+
+
+# pylint: disable=too-few-public-methods
+class FastJSONEngine(PlotlyJSONEngine):
+    """
+    Same output as `PlotlyJSONEngine` in a single encoding pass, with fast
+    paths for the components, numpy arrays and pandas series. On Python 2
+    the keys may come in another order, `PlotlyJSONEngine` reorders them.
+    """
+
+    def dumps(self, obj):
+        try:
+            return _dumps(obj, _FastJSONEncoder, allow_nan=False)
+        except ValueError:
+            # `PlotlyJSONEncoder` turns NaN and Infinity into `null`.
+            return super(FastJSONEngine, self).dumps(obj)
+
+
+_encode_basic = json.JSONEncoder().encode
+
+
+def _iterencode(obj, encoder):
+    if isinstance(obj, Component):
+        obj = obj.to_plotly_json()
+
+    if isinstance(obj, RawJSON):
+        yield obj.text
+    elif isinstance(obj, (six.string_types, bool, six.integer_types)) or \
+            obj is None:
+        yield _encode_basic(obj)
+    elif isinstance(obj, float) and not (math.isnan(obj) or
+                                         math.isinf(obj)):
+        yield _encode_basic(obj)
+    elif isinstance(obj, dict) and \
+            all(isinstance(key, six.string_types) for key in obj):
+        yield '{'
+        for i, (key, value) in enumerate(obj.items()):
+            yield '{}{}: '.format(', ' if i else '', _encode_basic(key))
+            for chunk in _iterencode(value, encoder):
+                yield chunk
+        yield '}'
+    elif isinstance(obj, (list, tuple)):
+        yield '['
+        for i, value in enumerate(obj):
+            if i:
+                yield ', '
+            for chunk in _iterencode(value, encoder):
+                yield chunk
+        yield ']'
+    else:
+        # NaN, arrays, figures...
+        yield encoder.splice(encoder.encode(obj))
+
+
+def iterencode(obj, chunk_size=16 * 1024):
+    """
+    Yield the JSON of `obj` in chunks of about `chunk_size` characters, the
+    same JSON as `PlotlyJSONEngine`, up to the order of the keys on Python 2.
+    The components, dicts and lists are walked as they are encoded, the
+    memory used doesn't grow with the size of the output but with the depth
+    of the tree.
+    """
+    encoder = _PlotlyJSONEncoder()
+    chunks = []
+    size = 0
+    for chunk in _iterencode(obj, encoder):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield ''.join(chunks)
+            chunks = []
+            size = 0
+    if chunks:
+        yield ''.join(chunks)
+
+
+_engines = {
+    'plotly': PlotlyJSONEngine,
+    'fast': FastJSONEngine,
+}
+
+
+def get_engine(engine):
+    """
+    The engine for the `json_engine` argument of `Dash`, the name of a
+    builtin engine or an object with a `dumps` method.
+    """
+    if hasattr(engine, 'dumps'):
+        return engine
+    if engine in _engines:
+        return _engines[engine]()
+    raise exceptions.InvalidConfig(
+        'Invalid `json_engine` `{}`, use one of {} or an object with '
+        'a `dumps` method.'.format(engine, sorted(_engines)))
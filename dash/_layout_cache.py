@@ -0,0 +1,119 @@
+import hashlib
+import threading
+import zlib
+
+import flask
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _gzip(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+_compressors = {'gzip': _gzip}
+if brotli is not None:
+    _compressors['br'] = lambda data: brotli.compress(data, quality=9)
+
+
+# pylint: disable=too-few-public-methods
+class SerializedLayout(object):
+    """
+    A serialized layout with its content hash ETag, the compressed variants
+    are made on their first request and kept.
+
+    :param body: The JSON of the layout.
+    """
+
+    def __init__(self, body):
+        self.body = body.encode('utf-8')
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self._variants = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.body) + sum(len(v) for v in self._variants.values())
+
+    @staticmethod
+    def _encoding(request, compress):
+        if not compress:
+            return None
+        # Brotli is preferred, it's smaller for the same decoding time.
+        for encoding in ('br', 'gzip'):
+            if (encoding in _compressors and
+                    request.accept_encodings[encoding]):
+                return encoding
+        return None
+
+    def _variant(self, encoding):
+        with self._lock:
+            if encoding not in self._variants:
+                self._variants[encoding] = \
+                    _compressors[encoding](self.body)
+            return self._variants[encoding]
+
+    def compress_all(self):
+        """
+        Make all the compressed variants now, e.g. before the layout is kept
+        in a cache bounded by size.
+        """
+        for encoding in _compressors:
+            self._variant(encoding)
+
+    def response(self, compress=True, min_size=500):
+        """
+        The response to the current request, `304` if not modified.
+
+        :param compress: Serve the compressed variants, as Flask-Compress
+            does when the app is created with `compress=True`.
+        :param min_size: Size in bytes under which the body isn't compressed.
+        """
+        request = flask.request
+        compress = compress and len(self.body) >= min_size
+        encoding = self._encoding(request, compress)
+        # Each encoding is a different representation with its own ETag.
+        etag = self.etag if encoding is None \
+            else '{}-{}'.format(self.etag, encoding)
+
+        if request.if_none_match.contains(etag):
+            response = flask.Response(status=304)
+        elif encoding is None:
+            response = flask.Response(
+                self.body, mimetype='application/json')
+        else:
+            response = flask.Response(
+                self._variant(encoding), mimetype='application/json')
+            response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        if compress:
+            response.vary.add('Accept-Encoding')
+        return response
+
+
+def streamed_response(chunks, compress=True):
+    """
+    A chunked JSON response of the string `chunks`, gzipped on the fly when
+    the client accepts it so Flask-Compress doesn't buffer the body.
+    """
+    if not compress or not flask.request.accept_encodings['gzip']:
+        return flask.Response(
+            (chunk.encode('utf-8') for chunk in chunks),
+            mimetype='application/json')
+
+    def gzipped():
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode('utf-8'))
+            if data:
+                yield data
+        yield compressor.flush()
+
+    response = flask.Response(gzipped(), mimetype='application/json')
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
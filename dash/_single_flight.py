@@ -0,0 +1,132 @@
+import errno
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class _Call(object):
+    # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# pylint: disable=too-few-public-methods
+class SingleFlight(object):
+    """
+    Coalesce the concurrent calls with the same key, the first call runs the
+    function and the others wait for its result.
+
+    With a `lock_dir`, the processes sharing the directory are coalesced
+    too: the leading call of each process takes a file lock on the key and
+    the result is written next to it for the processes waiting on the lock.
+
+    :param lock_dir: Directory of the lock and result files, created if it
+        doesn't exist, only the threads of the process are coalesced if
+        `None`.
+    :param result_ttl: Seconds after which the unused result and lock files
+        are removed.
+    """
+
+    def __init__(self, lock_dir=None, result_ttl=60):
+        self.lock_dir = lock_dir if fcntl is not None else None
+        self.result_ttl = result_ttl
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._last_cleanup = time.time()
+
+        if self.lock_dir is not None:
+            try:
+                os.makedirs(self.lock_dir)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+    def do(self, key, func):
+        """Return `func()`, shared with the concurrent calls with `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            if self.lock_dir is None:
+                call.result = func()
+            else:
+                call.result = self._do_locked(key, func)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+    def _do_locked(self, key, func):
+        started = time.time()
+        path = os.path.join(self.lock_dir, key)
+
+        with open(path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # The lock files not used for `result_ttl` are removed.
+            os.utime(path + '.lock', None)
+            try:
+                # Written by another process while waiting for the lock.
+                try:
+                    if os.path.getmtime(path + '.result') >= started:
+                        with open(path + '.result', 'rb') as f:
+                            return f.read().decode('utf-8') or None
+                except (IOError, OSError):
+                    pass
+
+                result = func()
+
+                fd, tmp = tempfile.mkstemp(dir=self.lock_dir)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write((result or '').encode('utf-8'))
+                os.rename(tmp, path + '.result')
+                return result
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+                self._cleanup()
+
+    def _cleanup(self):
+        now = time.time()
+        if now - self._last_cleanup < self.result_ttl:
+            return
+        self._last_cleanup = now
+
+        for name in os.listdir(self.lock_dir):
+            path = os.path.join(self.lock_dir, name)
+            try:
+                if os.path.getmtime(path) >= now - self.result_ttl:
+                    continue
+                if name.endswith('.result'):
+                    os.remove(path)
+                elif name.endswith('.lock'):
+                    _remove_unused_lock(path)
+            except (IOError, OSError):
+                pass
+
+
+def _remove_unused_lock(path):
+    with open(path, 'a') as lock:
+        # Raises if another call holds the lock.
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.remove(path)
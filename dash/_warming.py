@@ -0,0 +1,145 @@
+import itertools
+import json
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import exceptions
+from . import _json
+from .development.base_component import Component
+
+
+def _as_sent(value):
+    # The value as the renderer sends it in an update request.
+    return json.loads(_json.PlotlyJSONEngine().dumps(value))
+
+
+def _domain(component, prop):
+    # Only the single values are enumerated, the lists of values of the
+    # checklists and multi dropdowns keep their value in the layout.
+    if (prop == 'value' and
+            isinstance(getattr(component, 'options', None), list) and
+            not getattr(component, 'multi', False) and
+            not isinstance(getattr(component, 'value', None), list)):
+        return [
+            option['value'] for option in component.options
+            if isinstance(option, dict) and 'value' in option
+        ]
+    return [_as_sent(getattr(component, prop, None))]
+
+
+def enumerate_calls(layout, callback_map, max_combinations):
+    """
+    The arguments of the memoized callbacks to precompute, the option values
+    of the dropdowns and radio items are enumerated and the other props,
+    including the values of the checklists, keep their value in the layout.
+
+    :return: A list of `(callback_id, args)`.
+    """
+    components = {}
+    if isinstance(layout, Component):
+        for component in itertools.chain(
+                [layout],
+                layout.traverse(component_type=Component, with_id=True)):
+            if getattr(component, 'id', None) is not None:
+                components[component.id] = component
+
+    calls = []
+    for callback_id, callback in callback_map.items():
+        if (callback['cache'] is None or callback['events'] or
+                callback['background']):
+            continue
+        if any(c not in components for c, _ in callback['args_plan']):
+            continue
+
+        domains = [
+            _domain(components[component_id], prop)
+            for component_id, prop in callback['args_plan']
+        ]
+        calls.extend(
+            (callback_id, list(args))
+            for args in itertools.islice(
+                itertools.product(*domains), max_combinations)
+        )
+    return calls
+
+
+# pylint: disable=too-many-instance-attributes
+class CacheWarmer(object):
+    """
+    Precomputes the cached responses of callbacks in a thread pool.
+
+    :param callback_map: The callbacks of the app.
+    :param max_workers: Number of callbacks computed at the same time.
+    :param throttle: Seconds each worker waits after a callback.
+    """
+
+    def __init__(self, callback_map, max_workers=2, throttle=0,
+                 logger=None):
+        self.callback_map = callback_map
+        self.calls = []
+        self.max_workers = max_workers
+        self.throttle = throttle
+        self.logger = logger
+        self.done = 0
+        self.failed = 0
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    def start(self, calls):
+        """Compute the `(callback_id, args)` of `calls`."""
+        self.calls = calls
+        self.started = time.time()
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def run(callback_id, args):
+            try:
+                self.callback_map[callback_id]['callback'](*args)
+                failed = False
+            except exceptions.PreventUpdate:
+                failed = False
+            except Exception:  # pylint: disable=broad-except
+                failed = True
+                if self.logger is not None:
+                    self.logger.debug(
+                        'Cache warming of `%s` failed', callback_id,
+                        exc_info=True)
+
+            if self.throttle:
+                time.sleep(self.throttle)
+
+            with self._lock:
+                self.done += 1
+                self.failed += failed
+                last = self.done == len(self.calls)
+            if last:
+                self._finish()
+
+        if not self.calls:
+            self._finish()
+        for callback_id, args in self.calls:
+            pool.submit(run, callback_id, args)
+        pool.shutdown(wait=False)
+
+    def _finish(self):
+        self.finished = time.time()
+        self._finished.set()
+        if self.logger is not None:
+            self.logger.info(
+                'Warmed %d callback responses in %.1fs, %d failed',
+                self.done, self.finished - self.started, self.failed)
+
+    def wait(self, timeout=None):
+        """Wait for the warming to finish, return `False` on timeout."""
+        return self._finished.wait(timeout)
+
+    def progress(self):
+        return {
+            'total': len(self.calls),
+            'done': self.done,
+            'failed': self.failed,
+            'finished': self.finished is not None
+        }
@@ -0,0 +1,441 @@
+import collections
+import errno
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import plotly
+
+from . import exceptions
+from . import _json
+from ._layout_cache import SerializedLayout
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# `os.rename` doesn't replace an existing file on Windows.
+_replace = getattr(os, 'replace', os.rename)
+
+
+def callback_key(callback_id, args):
+    """Canonical hash of a callback invocation."""
+    payload = json.dumps(
+        [callback_id, list(args)],
+        cls=plotly.utils.PlotlyJSONEncoder,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CallbackCache(object):
+    """
+    Base class of the stores used by `app.callback(memoize=...)`.
+
+    The values are the serialized JSON responses of the callbacks, the keys
+    are given by `callback_key`.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+# pylint: disable=too-many-instance-attributes
+class MemoryCache(CallbackCache):
+    """
+    In process LRU cache of serialized callback responses.
+
+    :param max_size: Budget in bytes for the stored responses.
+    :param ttl: Number of seconds before an entry expires, never if `None`.
+    """
+
+    def __init__(self, max_size=64 * 1024 * 1024, ttl=None):
+        super(MemoryCache, self).__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires = entry
+            if expires is not None and expires < time.time():
+                self.size -= len(value)
+                self.misses += 1
+                return None
+
+            # Re-insert to mark as the most recently used.
+            self._entries[key] = entry
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        if len(value) > self.max_size:
+            return
+
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[0])
+
+            self._entries[key] = (value, expires)
+            self.size += len(value)
+
+            while self.size > self.max_size:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= len(entry[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def info(self):
+        info = super(MemoryCache, self).info()
+        info.update({
+            'entries': len(self._entries),
+            'size': self.size,
+            'max_size': self.max_size
+        })
+        return info
+
+
+class DiskCache(CallbackCache):
+    """
+    Cache of serialized callback responses in a directory, shared by the
+    worker processes of the host and kept across restarts.
+
+    The entries are files named by their key, written to a temporary file
+    and renamed so the readers never see a partial entry. The least recently
+    read entries are removed once the directory grows over `max_size`, the
+    eviction is done by a single process at a time.
+
+    :param directory: Directory of the entries, created if needed.
+    :param max_size: Budget in bytes for the stored responses.
+    :param ttl: Number of seconds before an entry expires, never if `None`.
+    """
+
+    def __init__(self, directory, max_size=1024 * 1024 * 1024, ttl=None):
+        super(DiskCache, self).__init__()
+        self.directory = directory
+        self.max_size = max_size
+        self.ttl = ttl
+        # Bytes written since the last size check of the directory.
+        self._written = 0
+        self._lock = threading.Lock()
+
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = f.read().decode('utf-8')
+            mtime = os.path.getmtime(path)
+            if self.ttl is not None and mtime + self.ttl < time.time():
+                self._remove(path)
+                value = None
+            else:
+                # The access time orders the eviction.
+                os.utime(path, (time.time(), mtime))
+        except (IOError, OSError):
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value):
+        data = value.encode('utf-8')
+        if len(data) > self.max_size:
+            return
+
+        path = self._path(key)
+        try:
+            os.mkdir(os.path.dirname(path))
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+        fd, tmp = tempfile.mkstemp(prefix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            _replace(tmp, path)
+        except Exception:
+            self._remove(tmp)
+            raise
+
+        with self._lock:
+            self._written += len(data)
+            check = self._written > self.max_size // 10
+            if check:
+                self._written = 0
+        if check:
+            self._evict()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        for subdirectory in os.listdir(self.directory):
+            subdirectory = os.path.join(self.directory, subdirectory)
+            if not os.path.isdir(subdirectory):
+                continue
+            for name in os.listdir(subdirectory):
+                path = os.path.join(subdirectory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat
+
+    def _evict(self):
+        with open(os.path.join(self.directory, '.lock'), 'a') as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except (IOError, OSError):
+                    # Another process is already evicting.
+                    return
+            try:
+                entries = sorted(
+                    self._entries(), key=lambda entry: entry[1].st_atime)
+                size = sum(stat.st_size for _, stat in entries)
+                for path, stat in entries:
+                    if size <= self.max_size:
+                        break
+                    self._remove(path)
+                    size -= stat.st_size
+                    with self._lock:
+                        self.evictions += 1
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def delete(self, key):
+        self._remove(self._path(key))
+
+    def clear(self):
+        for path, _ in list(self._entries()):
+            self._remove(path)
+
+    def info(self):
+        info = super(DiskCache, self).info()
+        entries = list(self._entries())
+        info.update({
+            'entries': len(entries),
+            'size': sum(stat.st_size for _, stat in entries),
+            'max_size': self.max_size
+        })
+        return info
+
+
+class TieredCache(CallbackCache):
+    """
+    Chain of caches from the fastest to the slowest, the entries found in a
+    slower tier are copied to the faster ones.
+
+    :param caches: The `CallbackCache` tiers, e.g. a `MemoryCache` in front
+        of a `DiskCache`.
+    """
+
+    def __init__(self, *caches):
+        super(TieredCache, self).__init__()
+        self.caches = caches
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        for i, cache in enumerate(self.caches):
+            value = cache.get(key)
+            if value is not None:
+                for faster in self.caches[:i]:
+                    faster.set(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        for cache in self.caches:
+            cache.set(key, value)
+
+    def delete(self, key):
+        for cache in self.caches:
+            cache.delete(key)
+
+    def clear(self):
+        for cache in self.caches:
+            cache.clear()
+
+    def info(self):
+        info = super(TieredCache, self).info()
+        info['tiers'] = [cache.info() for cache in self.caches]
+        return info
+
+
+class Generations(object):
+    """
+    Invalidation counters of the callbacks, the tags and the arguments.
+
+    The counters are kept in memory or, with a `directory`, in files shared
+    by the worker processes of the host: each invalidation appends a byte to
+    the file of the counter and its size is the generation.
+
+    :param directory: Directory of the shared counters, created if needed.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._counters = collections.defaultdict(int)
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            try:
+                os.makedirs(directory)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+    def _path(self, name):
+        return os.path.join(
+            self.directory,
+            hashlib.sha1(name.encode('utf-8')).hexdigest())
+
+    def get(self, name):
+        if self.directory is None:
+            return self._counters.get(name, 0)
+        try:
+            return os.stat(self._path(name)).st_size
+        except OSError:
+            return 0
+
+    def bump(self, name):
+        """Invalidate the entries depending on the counter `name`."""
+        if self.directory is None:
+            with self._lock:
+                self._counters[name] += 1
+            return
+        with open(self._path(name), 'ab') as f:
+            f.write(b'.')
+
+
+class CachedLayout(object):
+    """
+    A layout function whose serialized layouts are kept and served again,
+    assign it to `app.layout`::
+
+        app.layout = dash.caching.CachedLayout(
+            serve_layout, ttl=60,
+            key=lambda: flask.request.headers.get('X-User'))
+
+    :param func: The layout function.
+    :param ttl: Number of seconds before the function is called again,
+        never if `None`.
+    :param key: Function returning the key of the current request, e.g. its
+        user or URL, a layout is kept for each key.
+    :param max_size: Budget in bytes for the serialized layouts and their
+        compressed variants.
+    """
+
+    def __init__(self, func, ttl=None, key=None, max_size=16 * 1024 * 1024):
+        self.func = func
+        self.key = key
+        self.cache = MemoryCache(max_size=max_size, ttl=ttl)
+
+    def serialized(self, dumps=None, compress=True, min_size=500):
+        """
+        The `SerializedLayout` of the current request, only the bytes are
+        kept. Its compressed variants are made before it's stored so they're
+        counted in `max_size`, see `SerializedLayout.response` for
+        `compress` and `min_size`.
+        """
+        key = self.key() if self.key is not None else None
+        serialized = self.cache.get(key)
+        if serialized is None:
+            dumps = dumps or _json.PlotlyJSONEngine().dumps
+            serialized = SerializedLayout(dumps(self.func()))
+            if compress and len(serialized.body) >= min_size:
+                serialized.compress_all()
+            self.cache.set(key, serialized)
+        return serialized
+
+    def __call__(self):
+        # The component trees aren't kept, they take several times the
+        # memory of their JSON.
+        return self.func()
+
+
+def make_cache(memoize):
+    """Build the cache for the `memoize` argument of `app.callback`."""
+    if memoize is None or memoize is False:
+        return None
+    if memoize is True:
+        return MemoryCache()
+    if isinstance(memoize, dict):
+        return MemoryCache(**memoize)
+    if isinstance(memoize, CallbackCache):
+        return memoize
+    if (isinstance(memoize, (list, tuple)) and memoize and
+            all(isinstance(cache, CallbackCache) for cache in memoize)):
+        return TieredCache(*memoize)
+    raise exceptions.IncorrectTypeException(
+        '`memoize` must be a boolean, a dict of `MemoryCache` options, '
+        'a `CallbackCache` instance or a list of them, '
+        'got `{}`.'.format(memoize))
@@ -15,16 +15,23 @@ import logging
 
 from functools import wraps
 
-import plotly
 import dash_renderer
 import flask
 from flask import Flask, Response
 from flask_compress import Compress
+import six
 
 from .dependencies import Event, Input, Output, State
 from .resources import Scripts, Css
 from .development.base_component import Component
+from .lazy import Lazy
 from . import exceptions
+from . import caching
+from . import _executors
+from . import _json
+from . import _layout_cache
+from . import _single_flight
+from . import _warming
 from ._utils import AttributeDict as _AttributeDict
 from ._utils import interpolate_str as _interpolate
 from ._utils import format_tag as _format_tag
@@ -68,8 +75,19 @@ _re_index_config_id = re.compile(r'id="_dash-config"')
 _re_index_scripts_id = re.compile(r'src=".*dash[-_]renderer.*"')
 
 
+# pylint: disable=too-few-public-methods
+class _NoUpdate(object):
+    def __repr__(self):
+        return 'no_update'
+
+
+# Return it from a callback to leave an output unchanged.
+no_update = _NoUpdate()
+
+
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=too-many-arguments, too-many-locals
+# pylint: disable=too-many-public-methods
 class Dash(object):
     def __init__(
             self,
@@ -91,6 +109,11 @@ class Dash(object):
             external_stylesheets=None,
             suppress_callback_exceptions=None,
             components_cache_max_age=None,
+            process_pool_size=None,
+            json_engine=None,
+            single_flight_dir=None,
+            cache_invalidation_dir=None,
+            stream_layout=False,
             **kwargs):
 
         # pylint-disable: too-many-instance-attributes
@@ -143,9 +166,18 @@ class Dash(object):
                 'assets_external_path', assets_external_path, env_configs, ''),
             'components_cache_max_age': int(_configs.get_config(
                 'components_cache_max_age', components_cache_max_age,
-                env_configs, 2678400))
+                env_configs, 2678400)),
+            # Maximum number of sequential callbacks resolved by a chained
+            # update request.
+            'callback_chain_depth': 5,
+            # Encode the layouts of the layout functions as they are sent.
+            'stream_layout': stream_layout
         })
 
+        # serializer of the layout and callback responses
+        self._json = _json.get_engine(_configs.get_config(
+            'json_engine', json_engine, env_configs, 'plotly'))
+
         # list of dependencies
         self.callback_map = {}
 
@@ -154,14 +186,14 @@ class Dash(object):
         self._meta_tags = meta_tags or []
         self._favicon = None
 
+        self._compress = compress
         if compress:
             # gzip
             Compress(self.server)
 
         @self.server.errorhandler(exceptions.PreventUpdate)
-        def _handle_error(error):
+        def _handle_error(_):
             """Handle a halted callback and return an empty 204 response"""
-            print(error, file=sys.stderr)
             return ('', 204)
 
         # static files from the packages
@@ -193,6 +225,23 @@ class Dash(object):
             self.dispatch,
             ['POST'])
 
+        self._add_url(
+            '{}_dash-update-component-batch'.format(
+                self.config['routes_pathname_prefix']),
+            self.dispatch_batch,
+            ['POST'])
+
+        self._add_url(
+            '{}_dash-job/<string:job_id>'.format(
+                self.config['routes_pathname_prefix']),
+            self.serve_job,
+            ['GET', 'DELETE'])
+
+        self._add_url(
+            '{}_dash-layout-subtree/<string:component_id>'.format(
+                self.config['routes_pathname_prefix']),
+            self.serve_subtree)
+
         self._add_url((
             '{}_dash-component-suites'
             '/<string:package_name>'
@@ -225,6 +274,8 @@ class Dash(object):
 
         self._layout = None
         self._cached_layout = None
+        # serialized static layout, made on its first request.
+        self._serialized_layout = None
         self._dev_tools = _AttributeDict({
             'serve_dev_bundles': False,
             'hot_reload': False,
@@ -246,9 +297,33 @@ class Dash(object):
         self._watch_thread = None
         self._changed_assets = []
 
+        # event loop of the coroutine callbacks, started on first use.
+        self._event_loop = _executors.EventLoopThread()
+
         self.logger = logging.getLogger(name)
         self.logger.addHandler(logging.StreamHandler(stream=sys.stdout))
 
+        # background callbacks
+        self._jobs = _executors.JobManager(logger=self.logger)
+
+        # callbacks computed once per tick with `interval`
+        self._ticks = _executors.TickScheduler(logger=self.logger)
+
+        # workers of the callbacks with `executor='process'`
+        self._process_pool = _executors.ProcessPool(process_pool_size)
+
+        # in-flight calls of the callbacks with `single_flight=True`,
+        # shared with the processes using the same `single_flight_dir`.
+        self._single_flight = _single_flight.SingleFlight(single_flight_dir)
+
+        # invalidations of the memoized callbacks, shared with the processes
+        # using the same `cache_invalidation_dir`.
+        self._cache_generations = caching.Generations(cache_invalidation_dir)
+
+        # precomputation of the memoized callbacks, see `warm_callbacks`
+        self._warmer = None
+        self._warm_max_combinations = None
+
     def _add_url(self, name, view_func, methods=('GET',)):
         self.server.add_url_rule(
             name,
@@ -282,6 +357,7 @@ class Dash(object):
                 'a dash component.')
 
         self._layout = value
+        self._serialized_layout = None
 
         layout_value = self._layout_value()
         # pylint: disable=protected-access
@@ -309,15 +385,51 @@ class Dash(object):
         self._index_string = value
 
     def serve_layout(self):
+        min_size = self.server.config.get('COMPRESS_MIN_SIZE', 500)
+        if isinstance(self._layout, Component):
+            # A static layout is serialized and compressed once, reassign
+            # `app.layout` to serve the changes made to its components.
+            if self._serialized_layout is None:
+                self._serialized_layout = _layout_cache.SerializedLayout(
+                    self._json.dumps(self._layout))
+            serialized = self._serialized_layout
+        elif isinstance(self._layout, caching.CachedLayout):
+            serialized = self._layout.serialized(
+                self._json.dumps, compress=self._compress, min_size=min_size)
+        else:
+            serialized = None
+
+        if serialized is not None:
+            return serialized.response(
+                compress=self._compress, min_size=min_size)
+
         layout = self._layout_value()
 
+        if self.config.stream_layout:
+            return _layout_cache.streamed_response(
+                _json.iterencode(layout), compress=self._compress)
+
         # TODO - Set browser cache limit - pass hash into frontend
         return flask.Response(
-            json.dumps(layout,
-                       cls=plotly.utils.PlotlyJSONEncoder),
+            self._json.dumps(layout),
             mimetype='application/json'
         )
 
+    def serve_subtree(self, component_id):
+        """Serve the children of the `dash.lazy.Lazy` container."""
+        layout = self._layout_value()
+        for component in itertools.chain(
+                [layout], layout.traverse(component_type=Lazy)):
+            if (isinstance(component, Lazy) and
+                    component.children.id == component_id):
+                return flask.Response(
+                    self._json.dumps(component.children.children),
+                    mimetype='application/json')
+
+        return flask.Response(
+            'Lazy component "{}" not found.'.format(component_id),
+            status=404)
+
     def _config(self):
         config = {
             'url_base_pathname': self.url_base_pathname,
@@ -347,8 +459,7 @@ class Dash(object):
 
     def serve_routes(self):
         return flask.Response(
-            json.dumps(self.routes,
-                       cls=plotly.utils.PlotlyJSONEncoder),
+            self._json.dumps(self.routes),
             mimetype='application/json'
         )
 
@@ -605,17 +716,15 @@ class Dash(object):
                             app_entry=app_entry)
 
     def dependencies(self):
-        return flask.jsonify([
+        return flask.Response(self._json.dumps([
             {
-                'output': {
-                    'id': k.split('.')[0],
-                    'property': k.split('.')[1]
-                },
+                'output': k if v['multi'] else v['outputs'][0],
+                'outputs': v['outputs'],
                 'inputs': v['inputs'],
                 'state': v['state'],
                 'events': v['events']
             } for k, v in self.callback_map.items()
-        ])
+        ]), mimetype='application/json')
 
     # pylint: disable=unused-argument, no-self-use
     def react(self, *args, **kwargs):
@@ -641,7 +750,14 @@ class Dash(object):
                 `app.config['suppress_callback_exceptions']=True`
             '''.replace('    ', ''))
 
-        for args, obj, name in [([output], Output, 'Output'),
+        is_multi = isinstance(output, list)
+        outputs = output if is_multi else [output]
+        if is_multi and not outputs:
+            raise exceptions.IncorrectTypeException(
+                'The output argument is an empty list, '
+                'a callback needs at least one `dash.dependencies.Output`.')
+
+        for args, obj, name in [(outputs, Output, 'Output'),
                                 (inputs, Input, 'Input'),
                                 (state, State, 'State'),
                                 (events, Event, 'Event')]:
@@ -743,24 +859,30 @@ class Dash(object):
                 'elements' if len(state) > 1 else 'element'
             ).replace('    ', ''))
 
-        if '.' in output.component_id:
-            raise exceptions.IDsCantContainPeriods('''The Output element
-            `{}` contains a period in its ID.
-            Periods are not allowed in IDs right now.'''.format(
-                output.component_id
-            ))
+        registered = {
+            (o['id'], o['property'])
+            for callback in self.callback_map.values()
+            for o in callback['outputs']
+        }
+        for o in outputs:
+            if '.' in o.component_id:
+                raise exceptions.IDsCantContainPeriods('''The Output element
+                `{}` contains a period in its ID.
+                Periods are not allowed in IDs right now.'''.format(
+                    o.component_id
+                ))
 
-        callback_id = '{}.{}'.format(
-            output.component_id, output.component_property)
-        if callback_id in self.callback_map:
-            raise exceptions.CantHaveMultipleOutputs('''
-                You have already assigned a callback to the output
-                with ID "{}" and property "{}". An output can only have
-                a single callback function. Try combining your inputs and
-                callback functions together into one function.
-            '''.format(
-                output.component_id,
-                output.component_property).replace('    ', ''))
+            key = (o.component_id, o.component_property)
+            if key in registered:
+                raise exceptions.DuplicateCallbackOutput('''
+                    You have already assigned a callback to the output
+                    with ID "{}" and property "{}". An output can only have
+                    a single callback function. Try combining your inputs and
+                    callback functions together into one function.
+                '''.format(
+                    o.component_id,
+                    o.component_property).replace('    ', ''))
+            registered.add(key)
 
     def _validate_callback_output(self, output_value, output):
         valid = [str, dict, int, float, type(None), Component]
@@ -879,13 +1001,92 @@ class Dash(object):
     # TODO - Check this map for recursive or other ill-defined non-tree
     # relationships
     # pylint: disable=dangerous-default-value
-    def callback(self, output, inputs=[], state=[], events=[]):
+    def callback(self, output, inputs=[], state=[], events=[],
+                 memoize=None, background=False, executor=None,
+                 single_flight=False, cache_tags=None, interval=None):
+        """
+        Register the decorated function as the callback updating `output`.
+
+        `output` can be a list of `Output`, the callback then returns a
+        tuple with a value for each of them and they are all updated by the
+        same request.
+
+        Return `dash.no_update` to leave an output unchanged, the response
+        only has the updated outputs or is empty (204).
+
+        The function can be a coroutine function (`async def`), it is then
+        awaited on an event loop shared by all the requests of the app.
+
+        :param output: The component properties updated by the callback.
+        :type output: Output or list
+        :param inputs: The component properties triggering the callback.
+        :type inputs: list
+        :param state: Component properties given to the callback without
+            triggering it.
+        :type state: list
+        :param events: Component events triggering the callback.
+        :type events: list
+        :param memoize: Cache the serialized responses of the callback,
+            keyed on its arguments. `True` uses a `dash.caching.MemoryCache`
+            with the default options, a dict is given as keyword arguments
+            to `MemoryCache` and any `dash.caching.CallbackCache` instance
+            is used as is, e.g. a `dash.caching.DiskCache` shared by the
+            workers of the host. A list of caches is used as tiers, from the
+            fastest to the slowest.
+        :type memoize: bool, dict, CallbackCache or list
+        :param background: Run the callback in a background thread pool.
+            The update request returns a job id right away, the progress and
+            the response of the job are then polled on `_dash-job/<job_id>`.
+            The callback can report its progress with `app.set_progress`.
+        :type background: bool
+        :param executor: `'process'` runs the callback and the serialization
+            of its response in the process pool of the app, sized with the
+            `process_pool_size` argument of `Dash`. The workers are forked so
+            the callback doesn't need to be picklable, only its arguments and
+            return value. Not supported where the workers can't be forked,
+            e.g. on Windows.
+        :type executor: str
+        :param single_flight: The concurrent requests with the same arguments
+            wait for the first one and share its response instead of calling
+            the callback again. The worker processes are coalesced too when
+            the app has a `single_flight_dir`, a directory they all share.
+        :type single_flight: bool
+        :param cache_tags: Tags of the memoized responses, invalidated
+            together with `app.invalidate(tag=...)`.
+        :type cache_tags: list
+        :param interval: Share the response between the clients sending the
+            same arguments, e.g. for the callbacks polled by a
+            `dcc.Interval`. The callback is called once every `interval`
+            seconds for each distinct tuple of arguments by a scheduler
+            thread, and the requests are answered with the response of the
+            current tick of their arguments. The scheduler stops calling it
+            for the arguments no client is polling with.
+        :type interval: float
+
+        The update requests with `"chain": true` also evaluate the callbacks
+        triggered by the updated props when their arguments are all in the
+        request, all the updates are then returned in one response.
+        """
         self._validate_callback(output, inputs, state, events)
-
-        callback_id = '{}.{}'.format(
-            output.component_id, output.component_property
-        )
+        if executor not in (None, 'process'):
+            raise exceptions.IncorrectTypeException(
+                'The executor `{}` is not supported, '
+                'use `\'process\'`.'.format(executor))
+        if interval is not None and (background or memoize):
+            raise exceptions.IncorrectTypeException(
+                'The callbacks with an `interval` are shared by all the '
+                'clients, they can\'t be `background` or `memoize`.')
+        cache = caching.make_cache(memoize)
+
+        multi = isinstance(output, list)
+        outputs = output if multi else [output]
+        callback_id = self._create_callback_id(output)
         self.callback_map[callback_id] = {
+            'outputs': [
+                {'id': c.component_id, 'property': c.component_property}
+                for c in outputs
+            ],
+            'multi': multi,
             'inputs': [
                 {'id': c.component_id, 'property': c.component_property}
                 for c in inputs
@@ -897,39 +1098,121 @@ class Dash(object):
             'events': [
                 {'id': c.component_id, 'event': c.component_event}
                 for c in events
-            ]
+            ],
+            # The positional arguments of the callback, compiled once so that
+            # `dispatch` can bind the request payload in a single pass.
+            'args_plan': [
+                (c.component_id, c.component_property)
+                for c in itertools.chain(inputs, state)
+            ],
+            'cache': cache,
+            'background': background,
+            'executor': executor,
+            'single_flight': single_flight,
+            'cache_tags': list(cache_tags or [])
         }
 
         def wrap_func(func):
-            @wraps(func)
-            def add_context(*args, **kwargs):
-
-                output_value = func(*args, **kwargs)
-                response = {
-                    'response': {
-                        'props': {
-                            output.component_property: output_value
+            if _executors.is_coroutine_function(func):
+                def call(*args, **kwargs):
+                    return self._event_loop.run(func(*args, **kwargs))
+            else:
+                call = func
+
+            def serialize(*args, **kwargs):
+                output_value = call(*args, **kwargs)
+                if multi:
+                    if (not isinstance(output_value, (list, tuple)) or
+                            len(output_value) != len(outputs)):
+                        raise exceptions.InvalidCallbackReturnValue('''
+                        The callback `{}` has {} outputs and must return
+                        a list or a tuple of {} values, it returned:
+                        {}
+                        '''.format(callback_id, len(outputs), len(outputs),
+                                   repr(output_value)).replace('    ', ''))
+
+                    values = [
+                        (o, value) for o, value in zip(outputs, output_value)
+                        if value is not no_update
+                    ]
+                    if not values:
+                        return None
+
+                    response = {'response': {}, 'multi': True}
+                    for o, value in values:
+                        response['response'].setdefault(
+                            o.component_id, {})[o.component_property] = value
+                else:
+                    if output_value is no_update:
+                        return None
+
+                    response = {
+                        'response': {
+                            'props': {
+                                output.component_property: output_value
+                            }
                         }
                     }
-                }
+                    values = [(output, output_value)]
 
                 try:
-                    jsonResponse = json.dumps(
-                        response,
-                        cls=plotly.utils.PlotlyJSONEncoder
-                    )
+                    return self._json.dumps(response)
                 except TypeError:
-                    self._validate_callback_output(output_value, output)
+                    for o, value in values:
+                        self._validate_callback_output(value, o)
                     raise exceptions.InvalidCallbackReturnValue('''
-                    The callback for property `{property:s}`
-                    of component `{id:s}` returned a value
+                    The callback for {outputs:s} returned a value
                     which is not JSON serializable.
 
                     In general, Dash properties can only be
                     dash components, strings, dictionaries, numbers, None,
                     or lists of those.
-                    '''.format(property=output.component_property,
-                               id=output.component_id))
+                    '''.format(outputs=', '.join(
+                        'property `{}` of component `{}`'.format(
+                            o.component_property, o.component_id)
+                        for o in outputs)))
+
+            if executor == 'process':
+                process_key = self._process_pool.register(serialize)
+
+                def compute(*args):
+                    return self._process_pool.run(process_key, *args)
+            else:
+                compute = serialize
+
+            if interval is not None:
+                self._ticks.register(callback_id, compute, interval)
+
+            @wraps(func)
+            def add_context(*args, **kwargs):
+                cache_key = None
+                if cache is not None and not kwargs:
+                    cache_key = self._cache_key(callback_id, args)
+                    cached = cache.get(cache_key)
+                    if cached == '':
+                        return flask.Response(status=204)
+                    if cached is not None:
+                        return flask.Response(
+                            cached,
+                            mimetype='application/json'
+                        )
+
+                if kwargs:
+                    jsonResponse = serialize(*args, **kwargs)
+                elif interval is not None:
+                    jsonResponse = self._ticks.get(callback_id, *args)
+                elif single_flight:
+                    jsonResponse = self._single_flight.do(
+                        cache_key or caching.callback_key(callback_id, args),
+                        lambda: compute(*args))
+                else:
+                    jsonResponse = compute(*args)
+
+                if cache_key is not None:
+                    cache.set(cache_key, jsonResponse or '')
+
+                if not jsonResponse:
+                    return flask.Response(status=204)
 
                 return flask.Response(
                     jsonResponse,
@@ -942,29 +1225,344 @@ class Dash(object):
 
         return wrap_func
 
+    def cache_info(self):
+        """
+        Hit, miss and eviction counters of the memoized callbacks.
+
+        :return: A dict of the cache info by callback id.
+        """
+        return {
+            callback_id: callback['cache'].info()
+            for callback_id, callback in self.callback_map.items()
+            if callback['cache'] is not None
+        }
+
+    def _cache_key(self, callback_id, args):
+        key = caching.callback_key(callback_id, args)
+        tags = self.callback_map[callback_id]['cache_tags']
+        names = ['callback:' + callback_id, 'args:' + key] + [
+            'tag:' + tag for tag in tags
+        ]
+        generations = [self._cache_generations.get(name) for name in names]
+        if not any(generations):
+            return key
+        # The entries of the previous generations are never read again and
+        # are evicted by the cache.
+        return caching.callback_key(key, generations)
+
+    def invalidate(self, tag=None, callback=None, args=None):
+        """
+        Invalidate memoized callback responses, in all the worker processes
+        when the app has a `cache_invalidation_dir` shared by them.
+
+        :param tag: Invalidate the responses of the callbacks registered
+            with this tag in `cache_tags`.
+        :param callback: Invalidate the responses of a callback, given by
+            its `Output`, list of `Output` or id.
+        :param args: Only invalidate the response of the callback for these
+            arguments, the values of its inputs then states.
+        :type args: list
+        """
+        if args is not None and callback is None:
+            raise exceptions.IncorrectTypeException(
+                '`args` can only be invalidated with a `callback`.')
+
+        if tag is not None:
+            self._cache_generations.bump('tag:' + tag)
+
+        if callback is not None:
+            callback_id = callback \
+                if isinstance(callback, six.string_types) \
+                else self._create_callback_id(callback)
+            if callback_id not in self.callback_map:
+                raise exceptions.UnknownCallback(
+                    'No callback is registered for `{}`.'.format(callback_id))
+
+            if args is None:
+                self._cache_generations.bump('callback:' + callback_id)
+            else:
+                key = caching.callback_key(callback_id, args)
+                cache = self.callback_map[callback_id]['cache']
+                if cache is not None:
+                    cache.delete(self._cache_key(callback_id, args))
+                self._cache_generations.bump('args:' + key)
+
+    def warm_callbacks(self, max_workers=2, throttle=0, max_combinations=256):
+        """
+        Precompute the responses of the memoized callbacks in a background
+        thread pool once the server is set up, on the first request.
+
+        The `options` of the single value dropdowns and radio items in the
+        layout are enumerated for their `value` inputs. The other inputs and
+        states keep their value in the layout, including the `values` of the
+        checklists and the `value` of the multi dropdowns, as their subsets
+        of options grow exponentially.
+
+        :param max_workers: Number of callbacks computed at the same time.
+        :param throttle: Seconds each worker waits after a callback, to
+            spare the data sources.
+        :param max_combinations: Maximum number of argument combinations
+            computed for each callback.
+        :return: The warmer, its `progress()` reports the number of
+            computed responses.
+        """
+        self._warmer = _warming.CacheWarmer(
+            self.callback_map,
+            max_workers=max_workers,
+            throttle=throttle,
+            logger=self.logger)
+        self._warm_max_combinations = max_combinations
+        if self.server.got_first_request:
+            self._start_warming()
+        return self._warmer
+
+    def _start_warming(self):
+        self._warmer.start(_warming.enumerate_calls(
+            self._layout_value(),
+            self.callback_map,
+            self._warm_max_combinations))
+
+    def _bind_callback_args(self, target_id, body):
+        values = {
+            (c['id'], c['property']): c.get('value', None)
+            for c in itertools.chain(body.get('inputs', []),
+                                     body.get('state', []))
+        }
+
+        args = []
+        for component_id, component_property in \
+                self.callback_map[target_id]['args_plan']:
+            try:
+                args.append(values[(component_id, component_property)])
+            except KeyError:
+                raise exceptions.MissingCallbackArgument(
+                    'The request for the callback `{}` is missing the '
+                    'value of the property `{}` of the component '
+                    '`{}`.'.format(
+                        target_id, component_property, component_id))
+        return args
+
+    @staticmethod
+    def _create_callback_id(output):
+        if isinstance(output, list):
+            return '..{}..'.format('...'.join(
+                '{}.{}'.format(o.component_id, o.component_property)
+                for o in output
+            ))
+        return '{}.{}'.format(output.component_id, output.component_property)
+
+    def _dispatch_callback(self, body):
+        output = body['output']
+
+        # The output of a multi output callback is its id.
+        if isinstance(output, dict):
+            target_id = '{}.{}'.format(output['id'], output['property'])
+        else:
+            target_id = output
+        args = self._bind_callback_args(target_id, body)
+
+        callback = self.callback_map[target_id]
+        if callback['background']:
+            job_id = self._jobs.submit(callback['callback'], *args)
+            return flask.Response(
+                json.dumps({'job': job_id}),
+                status=202,
+                mimetype='application/json'
+            )
+
+        response = callback['callback'](*args)
+        if body.get('chain') and response.status_code == 200:
+            return self._resolve_chain(target_id, body, response)
+        return response
+
+    def _response_props(self, callback_id, response):
+        data = json.loads(response.get_data(as_text=True))['response']
+        callback = self.callback_map[callback_id]
+        if callback['multi']:
+            return [
+                ((component_id, prop), value)
+                for component_id, props in data.items()
+                for prop, value in props.items()
+            ]
+        component_id = callback['outputs'][0]['id']
+        return [
+            ((component_id, prop), value)
+            for prop, value in data['props'].items()
+        ]
+
+    # pylint: disable=too-many-branches
+    def _resolve_chain(self, target_id, body, response):
+        """
+        Evaluate the callbacks triggered by the response of `target_id`
+        whose inputs and state are all known in the request, the given
+        `inputs`, `state` and `context` and the updated props.
+
+        A callback is only evaluated once all the callbacks updating its
+        arguments were, each callback runs at most once and at most
+        `config.callback_chain_depth` levels of callbacks are evaluated.
+        The callbacks left pending are listed in the callback map but not in
+        the `resolved` ids of the response, for the renderer to request them.
+        So are the callbacks that fail, which are logged, and the ones
+        depending on their outputs.
+        """
+        known = {
+            (c['id'], c['property']): c.get('value', None)
+            for c in itertools.chain(body.get('inputs', []),
+                                     body.get('state', []),
+                                     body.get('context', []))
+        }
+        updates = collections.OrderedDict()
+        resolved = [target_id]
+        failed = set()
+
+        def merge(callback_id, callback_response):
+            for key, value in self._response_props(
+                    callback_id, callback_response):
+                known[key] = value
+                updates[key] = value
+
+        def outputs_of(callback_ids):
+            return {
+                (o['id'], o['property'])
+                for callback_id in callback_ids
+                for o in self.callback_map[callback_id]['outputs']
+            }
+
+        merge(target_id, response)
+
+        # All the callbacks triggered, directly or not, by the updates.
+        pending = set()
+        changed = set(updates)
+        while changed:
+            triggered = {
+                callback_id
+                for callback_id, callback in self.callback_map.items()
+                if callback_id != target_id and callback_id not in pending and
+                any((c['id'], c['property']) in changed
+                    for c in callback['inputs'])
+            }
+            pending |= triggered
+            changed = outputs_of(triggered)
+
+        for _ in range(self.config.callback_chain_depth):
+            ready = []
+            for callback_id in pending:
+                callback = self.callback_map[callback_id]
+                waiting = outputs_of((pending | failed) - {callback_id})
+                if (not callback['events'] and not callback['background'] and
+                        all(arg in known and arg not in waiting
+                            for arg in callback['args_plan'])):
+                    ready.append(callback_id)
+
+            if not ready:
+                break
+
+            for callback_id in sorted(ready):
+                pending.discard(callback_id)
+                callback = self.callback_map[callback_id]
+                if not any((c['id'], c['property']) in updates
+                           for c in callback['inputs']):
+                    # The updates that would trigger it were prevented.
+                    continue
+
+                try:
+                    callback_response = callback['callback'](*[
+                        known[arg] for arg in callback['args_plan']
+                    ])
+                except exceptions.PreventUpdate:
+                    callback_response = None
+                except Exception:  # pylint: disable=broad-except
+                    # Left for the renderer, the other updates are kept.
+                    self.server.log_exception(sys.exc_info())
+                    failed.add(callback_id)
+                    continue
+
+                resolved.append(callback_id)
+                if (callback_response is not None and
+                        callback_response.status_code == 200):
+                    merge(callback_id, callback_response)
+
+        data = {'response': {}, 'multi': True, 'resolved': resolved}
+        for (component_id, prop), value in updates.items():
+            data['response'].setdefault(component_id, {})[prop] = value
+
+        return flask.Response(
+            self._json.dumps(data),
+            mimetype='application/json'
+        )
+
     def dispatch(self):
         body = flask.request.get_json()
-        inputs = body.get('inputs', [])
-        state = body.get('state', [])
-        output = body['output']
+        return self._dispatch_callback(body)
 
-        target_id = '{}.{}'.format(output['id'], output['property'])
-        args = []
-        for component_registration in self.callback_map[target_id]['inputs']:
-            args.append([
-                c.get('value', None) for c in inputs if
-                c['property'] == component_registration['property'] and
-                c['id'] == component_registration['id']
-            ][0])
-
-        for component_registration in self.callback_map[target_id]['state']:
-            args.append([
-                c.get('value', None) for c in state if
-                c['property'] == component_registration['property'] and
-                c['id'] == component_registration['id']
-            ][0])
-
-        return self.callback_map[target_id]['callback'](*args)
+    def dispatch_batch(self):
+        """
+        Execute an array of callback requests in one round trip.
+
+        Each entry of the response array has the `status` of its callback,
+        `204` if the update was prevented, and the callback `response` on
+        success. A failing callback doesn't affect the others.
+        """
+        bodies = flask.request.get_json()
+        if not isinstance(bodies, list):
+            flask.abort(400)
+
+        responses = []
+        for body in bodies:
+            try:
+                response = self._dispatch_callback(body)
+            except exceptions.PreventUpdate:
+                responses.append('{"status": 204}')
+                continue
+            except Exception as e:  # pylint: disable=broad-except
+                self.server.log_exception(sys.exc_info())
+                error = {'status': 500}
+                if self.server.debug:
+                    error['error'] = '{}: {}'.format(type(e).__name__, e)
+                responses.append(json.dumps(error))
+                continue
+
+            if response.status_code == 204:
+                responses.append('{"status": 204}')
+            else:
+                responses.append('{{"status": {}, "response": {}}}'.format(
+                    response.status_code, response.get_data(as_text=True)))
+
+        return flask.Response(
+            '[' + ', '.join(responses) + ']',
+            mimetype='application/json'
+        )
+
+    def serve_job(self, job_id):
+        if flask.request.method == 'DELETE':
+            job = self._jobs.cancel(job_id)
+        else:
+            job = self._jobs.get(job_id)
+
+        if job is None:
+            return flask.Response(
+                'Job "{}" not found.'.format(job_id), status=404)
+
+        status = job.status
+        if status == 'done' and job.result.status_code == 204:
+            status = 'prevented'
+
+        data = '{{"status": "{}", "progress": {}'.format(
+            status,
+            self._json.dumps(job.progress))
+        if status == 'done':
+            data += ', "response": ' + job.result.get_data(as_text=True)
+
+        return flask.Response(data + '}', mimetype='application/json')
+
+    def set_progress(self, progress):
+        """
+        Report the progress of the running background callback, it is
+        returned to the clients polling the job.
+
+        Raises `dash.exceptions.CallbackCancelled` if the job was cancelled.
+        """
+        self._jobs.set_progress(progress)
 
     def _validate_layout(self):
         if self.layout is None:
@@ -980,8 +1578,8 @@ class Dash(object):
         layout_id = getattr(self.layout, 'id', None)
 
         component_ids = {layout_id} if layout_id else set()
-        for component in to_validate.traverse():
-            component_id = getattr(component, 'id', None)
+        for component in to_validate.traverse(with_id=True):
+            component_id = component.id
             if component_id and component_id in component_ids:
                 raise exceptions.DuplicateIdError(
                     'Duplicate component id found'
@@ -997,6 +1595,13 @@ class Dash(object):
         self._generate_scripts_html()
         self._generate_css_dist_html()
 
+        if any(callback['executor'] == 'process'
+               for callback in self.callback_map.values()):
+            self._process_pool.warm_up()
+
+        if self._warmer is not None:
+            self._start_warming()
+
     def _add_assets_resource(self, url_path, file_path):
         res = {'asset_path': url_path, 'filepath': file_path}
         if self.config.assets_external_path:
@@ -1,13 +1,15 @@
 import collections
 import copy
 import os
+import re
 
-from dash.development.base_component import _explicitize_args
 from ._all_keywords import python_keywords
 from .base_component import Component
 
+_identifier = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 
-# pylint: disable=unused-argument
+
+# pylint: disable=unused-argument,too-many-locals
 def generate_class_string(typename, props, description, namespace):
     """
     Dynamically generate class strings to have nicely formatted docstrings,
@@ -45,28 +47,17 @@ def generate_class_string(typename, props, description, namespace):
     # not all component authors will supply those.
     c = '''class {typename}(Component):
     """{docstring}"""
-    @_explicitize_args
+    __slots__ = {slots}
+    _prop_names = {list_of_valid_keys}
+    _type = '{typename}'
+    _namespace = '{namespace}'
+    _valid_wildcard_attributes = {list_of_valid_wildcard_attr_prefixes}
+    available_events = {events}
+    available_properties = {list_of_valid_keys}
+    available_wildcard_properties = {list_of_valid_wildcard_attr_prefixes}
+
     def __init__(self, {default_argtext}):
-        self._prop_names = {list_of_valid_keys}
-        self._type = '{typename}'
-        self._namespace = '{namespace}'
-        self._valid_wildcard_attributes =\
-            {list_of_valid_wildcard_attr_prefixes}
-        self.available_events = {events}
-        self.available_properties = {list_of_valid_keys}
-        self.available_wildcard_properties =\
-            {list_of_valid_wildcard_attr_prefixes}
-
-        _explicit_args = kwargs.pop('_explicit_args')
-        _locals = locals()
-        _locals.update(kwargs)  # For wildcard attrs
-        args = {{k: _locals[k] for k in _explicit_args if k != 'children'}}
-
-        for k in {required_args}:
-            if k not in args:
-                raise TypeError(
-                    'Required argument `' + k + '` was not specified.')
-        super({typename}, self).__init__({argtext})
+{explicit_args}        super({typename}, self).__init__({argtext})
 
     def __repr__(self):
         if(any(getattr(self, c, None) is not None
@@ -98,6 +89,8 @@ def generate_class_string(typename, props, description, namespace):
     # pylint: disable=unused-variable
     list_of_valid_keys = repr(list(map(str, filtered_props.keys())))
     # pylint: disable=unused-variable
+    slots = repr(tuple(map(str, prop_slots(filtered_props))))
+    # pylint: disable=unused-variable
     docstring = create_docstring(
         component_name=typename,
         props=filtered_props,
@@ -111,24 +104,64 @@ def generate_class_string(typename, props, description, namespace):
         prop_keys.remove('children')
         default_argtext = "children=None, "
         # pylint: disable=unused-variable
-        argtext = 'children=children, **args'
+        argtext = 'children=children, **kwargs'
     else:
         default_argtext = ""
-        argtext = '**args'
+        argtext = '**kwargs'
+    arg_keys = [
+        p for p in prop_keys
+        if not p.endswith("-*") and
+        p not in python_keywords and
+        p not in ['dashEvents', 'fireEvent', 'setProps']
+    ]
     default_argtext += ", ".join(
         [('{:s}=Component.REQUIRED'.format(p)
           if props[p]['required'] else
           '{:s}=Component.UNDEFINED'.format(p))
-         for p in prop_keys
-         if not p.endswith("-*") and
-         p not in python_keywords and
-         p not in ['dashEvents', 'fireEvent', 'setProps']] + ['**kwargs']
+         for p in arg_keys] + ['**kwargs']
     )
 
-    required_args = required_props(props)
+    # pylint: disable=unused-variable
+    explicit_args = explicit_args_code(
+        arg_keys, [p for p in required_props(props) if p != 'children'])
     return c.format(**locals())
 
 
+def explicit_args_code(arg_keys, required_args):
+    """
+    Generate the body of the `__init__` of a Component passing the explicit
+    arguments to `Component.__init__`, those that aren't left to their
+    `Component.UNDEFINED` default, and checking the required arguments
+
+    Parameters
+    ----------
+    arg_keys: list
+        Names of the props that are arguments of `__init__`
+    required_args: list
+        Names of the required props
+
+    Returns
+    -------
+    str
+        The statements, indented in the body of `__init__`
+    """
+    lines = []
+    for k in required_args:
+        lines.append(
+            '        if {} is Component.REQUIRED:\n'.format(k)
+            if k in arg_keys else
+            '        if \'{}\' not in kwargs:\n'.format(k))
+        lines.append(
+            '            raise TypeError(\n'
+            '                \'Required argument `{}` was not specified.\')'
+            '\n'.format(k))
+    for k in arg_keys:
+        lines.append(
+            '        if {0} is not Component.UNDEFINED:\n'
+            '            kwargs[\'{0}\'] = {0}\n'.format(k))
+    return ''.join(lines)
+
+
 def generate_class_file(typename, props, description, namespace):
     """
     Generate a python class file (.py) given a class string
@@ -146,8 +179,7 @@ def generate_class_file(typename, props, description, namespace):
     """
     import_string =\
         "# AUTO GENERATED FILE - DO NOT EDIT\n\n" + \
-        "from dash.development.base_component import " + \
-        "Component, _explicitize_args\n\n\n"
+        "from dash.development.base_component import Component\n\n\n"
     class_string = generate_class_string(
         typename,
         props,
@@ -209,7 +241,7 @@ def generate_class(typename, props, description, namespace):
 
     """
     string = generate_class_string(typename, props, description, namespace)
-    scope = {'Component': Component, '_explicitize_args': _explicitize_args}
+    scope = {'Component': Component}
     # pylint: disable=exec-used
     exec(string, scope)
     result = scope[typename]
@@ -233,6 +265,28 @@ def required_props(props):
             if prop['required']]
 
 
+def prop_slots(props):
+    """
+    Pull the names of the props stored in the `__slots__` of the Component,
+    the wildcard props and the props shadowing an attribute of `Component`
+    are stored in its `__dict__`
+
+    Parameters
+    ----------
+    props: dict
+        Dictionary with {propName: propMetadata} structure
+
+    Returns
+    -------
+    list
+        List of prop names (str) that are slots
+    """
+    return [prop_name for prop_name in props
+            if _identifier.match(prop_name) and
+            prop_name not in python_keywords and
+            not hasattr(Component, prop_name)]
+
+
 def create_docstring(component_name, props, events, description):
     """
     Create the Dash component docstring
@@ -63,8 +63,117 @@ def _check_if_has_indexable_children(item):
         raise KeyError
 
 
+_untracked_attributes = frozenset(['_set_props', '_id_index'])
+
+# The number of assignments of `children` to a component, the misses of the
+# ID indexes built since are trusted.
+_children_generation = [0]
+
+
+class _IdIndex(dict):
+    """The paths of the IDs of a tree of children, see `Component._find`."""
+
+    def __init__(self):
+        super(_IdIndex, self).__init__()
+        self.generation = _children_generation[0]
+
+
+class _PropTable(object):
+    """The props of a component class, computed once per class."""
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self, names, wildcard_attributes):
+        self.names = names
+        self.wildcard_attributes = wildcard_attributes
+        self.positions = {name: i for i, name in enumerate(names)}
+        # `str.startswith` takes a tuple of prefixes.
+        self.wildcards = tuple(wildcard_attributes)
+        last = len(names)
+        self.sort_key = lambda name: self.positions.get(name, last)
+
+
+def _get_child(parent, slot):
+    children = getattr(parent, 'children', None)
+    if slot is None:
+        return children if isinstance(children, Component) else None
+    if (isinstance(children, (tuple, collections.MutableSequence)) and
+            slot < len(children)):
+        return children[slot]
+    return None
+
+
+def _children_items(component, path):
+    children = getattr(component, 'children', None)
+    if isinstance(children, Component):
+        return [(children, path + ((component, None),))]
+    if isinstance(children, (tuple, collections.MutableSequence)):
+        return [
+            (child, path + ((component, i),))
+            for i, child in enumerate(children)
+        ]
+    return []
+
+
+def _index_ids(items, index):
+    """
+    Add the IDs of `items`, a list of `(item, path)`, and of their subtrees
+    to the index, the first item in depth first order wins.
+
+    A path is a tuple of `(parent, slot)` from the root to the item.
+    """
+    stack = list(reversed(items))
+    while stack:
+        item, path = stack.pop()
+        item_id = getattr(item, 'id', None)
+        if item_id is not None and item_id not in index:
+            index[item_id] = path
+        if isinstance(item, Component):
+            stack.extend(reversed(_children_items(item, path)))
+    return index
+
+
+def _path_segment(prefix, item):
+    return '{}{} {}'.format(
+        prefix,
+        type(item).__name__,
+        '(id={:s})'.format(item.id) if getattr(item, 'id', False) else '')
+
+
+def _push_children(stack, component, path, with_paths):
+    """Push the children, or `(path, child)`, on the traversal stack."""
+    children = getattr(component, 'children', None)
+    if isinstance(children, Component):
+        stack.append(
+            (_join_path(path, _path_segment('[*] ', children)), children)
+            if with_paths else children)
+    elif isinstance(children, (tuple, collections.MutableSequence)):
+        if with_paths:
+            stack.extend(
+                (_join_path(path, _path_segment('[{:d}] '.format(i), child)),
+                 child)
+                for i, child in reversed(list(enumerate(children))))
+        else:
+            stack.extend(reversed(children))
+
+
+def _join_path(path, segment):
+    return segment if path is None else path + '\n' + segment
+
+
 @six.add_metaclass(ComponentMeta)
 class Component(collections.MutableMapping):
+    # The generated components store their props in slots, the `__dict__`
+    # is only allocated for the wildcard props. `_id_index` maps the IDs to
+    # their path in the tree of children, see `_find`, and `_set_props` are
+    # the names of the props set on the component, in assignment order.
+    # On Python 2 the instances of `MutableMapping` already have a
+    # `__dict__` and a `__weakref__`, which can't be declared again.
+    __slots__ = ('_id_index', '_set_props') + tuple(
+        slot for slot, offset in (
+            ('__dict__', collections.MutableMapping.__dictoffset__),
+            ('__weakref__', collections.MutableMapping.__weakrefoffset__))
+        if not offset)
+
     class _UNDEFINED(object):
         def __repr__(self):
             return 'undefined'
@@ -83,15 +192,18 @@ class Component(collections.MutableMapping):
 
     REQUIRED = _REQUIRED()
 
+    def __new__(cls, *args, **kwargs):
+        # pylint: disable=unused-argument, no-member
+        component = super(Component, cls).__new__(cls)
+        object.__setattr__(component, '_set_props', {})
+        return component
+
     def __init__(self, **kwargs):
-        # pylint: disable=super-init-not-called
-        for k, v in list(kwargs.items()):
-            # pylint: disable=no-member
-            k_in_propnames = k in self._prop_names
-            k_in_wildcards = any([k.startswith(w)
-                                  for w in
-                                  self._valid_wildcard_attributes])
-            if not k_in_propnames and not k_in_wildcards:
+        # pylint: disable=super-init-not-called, no-member
+        table = self._prop_table()
+        set_props = self._set_props
+        for k, v in kwargs.items():
+            if k not in table.positions and not k.startswith(table.wildcards):
                 raise TypeError(
                     'Unexpected keyword argument `{}`'.format(k) +
                     '\nAllowed arguments: {}'.format(
@@ -99,22 +211,72 @@ class Component(collections.MutableMapping):
                         ', '.join(sorted(self._prop_names))
                     )
                 )
-            setattr(self, k, v)
+            # As `__setattr__` does, without the call.
+            object.__setattr__(self, k, v)
+            set_props[k] = None
+
+    def __setattr__(self, name, value):
+        # pylint: disable=no-member
+        super(Component, self).__setattr__(name, value)
+        if name == 'children':
+            _children_generation[0] += 1
+        # Track the props set on the component for `to_plotly_json`.
+        if name not in _untracked_attributes:
+            self._set_props[name] = None
+
+    def __delattr__(self, name):
+        # pylint: disable=no-member
+        super(Component, self).__delattr__(name)
+        if name == 'children':
+            _children_generation[0] += 1
+        self._set_props.pop(name, None)
+
+    def __copy__(self):
+        # The copy tracks its own set props, the `_id_index` is rebuilt.
+        # pylint: disable=no-member, protected-access
+        cls = type(self)
+        copied = cls.__new__(cls)
+        for name in self._set_props:
+            object.__setattr__(copied, name, getattr(self, name))
+        copied._set_props.update(self._set_props)
+        return copied
+
+    def __getstate__(self):
+        # The slots can't be pickled with the protocols 0 and 1, the set
+        # props are pickled in their order instead.
+        # pylint: disable=no-member
+        return [(name, getattr(self, name)) for name in self._set_props]
+
+    def __setstate__(self, state):
+        # `__new__` isn't called by the protocols 0 and 1.
+        object.__setattr__(self, '_set_props', {})
+        for name, value in state:
+            object.__setattr__(self, name, value)
+            self._set_props[name] = None  # pylint: disable=no-member
+
+    def _prop_table(self):
+        # pylint: disable=no-member
+        names = self._prop_names
+        wildcards = self._valid_wildcard_attributes
+        cls = type(self)
+        table = cls.__dict__.get('_prop_table_cache')
+        if table is None or not (
+                (table.names is names or table.names == names) and
+                (table.wildcard_attributes is wildcards or
+                 table.wildcard_attributes == wildcards)):
+            table = _PropTable(names, wildcards)
+            cls._prop_table_cache = table  # pylint: disable=protected-access
+        return table
 
     def to_plotly_json(self):
-        # Add normal properties
-        props = {
-            p: getattr(self, p)
-            for p in self._prop_names  # pylint: disable=no-member
-            if hasattr(self, p)
-        }
-        # Add the wildcard properties data-* and aria-*
-        props.update({
-            k: getattr(self, k)
-            for k in self.__dict__
-            if any(k.startswith(w) for w in
-                   self._valid_wildcard_attributes)  # pylint:disable=no-member
-        })
+        # pylint: disable=no-member
+        table = self._prop_table()
+        props = {}
+        # Sorted as the prop names, then the wildcard props.
+        for name in sorted(self._set_props, key=table.sort_key):
+            if name in table.positions or name.startswith(table.wildcards):
+                props[name] = getattr(self, name)
+
         as_json = {
             'props': props,
             'type': self._type,  # pylint: disable=no-member
@@ -123,71 +285,52 @@ class Component(collections.MutableMapping):
 
         return as_json
 
-    # pylint: disable=too-many-branches, too-many-return-statements
-    # pylint: disable=redefined-builtin, inconsistent-return-statements
-    def _get_set_or_delete(self, id, operation, new_item=None):
+    # pylint: disable=redefined-builtin
+    def _find(self, id):
+        """
+        The `(parent, slot)` of the item with the given ID in the tree of
+        children, `slot` is `None` if the item is the only child of its
+        parent or its index in the children.
+
+        The paths of the IDs are indexed on the first lookup. A path is
+        checked before it's used and the index is rebuilt when the tree was
+        changed without the mapping API. A missing ID is only looked up
+        again when a `children` was assigned since the index was built, the
+        IDs added in place to a list of children are found once a stale
+        path is.
+        """
         _check_if_has_indexable_children(self)
 
-        # pylint: disable=access-member-before-definition,
-        # pylint: disable=attribute-defined-outside-init
-        if isinstance(self.children, Component):
-            if getattr(self.children, 'id', None) is not None:
-                # Woohoo! It's the item that we're looking for
-                if self.children.id == id:
-                    if operation == 'get':
-                        return self.children
-                    elif operation == 'set':
-                        self.children = new_item
-                        return
-                    elif operation == 'delete':
-                        self.children = None
-                        return
-
-            # Recursively dig into its subtree
-            try:
-                if operation == 'get':
-                    return self.children.__getitem__(id)
-                elif operation == 'set':
-                    self.children.__setitem__(id, new_item)
-                    return
-                elif operation == 'delete':
-                    self.children.__delitem__(id)
-                    return
-            except KeyError:
-                pass
-
-        # if children is like a list
-        if isinstance(self.children, (tuple, collections.MutableSequence)):
-            for i, item in enumerate(self.children):
-                # If the item itself is the one we're looking for
-                if getattr(item, 'id', None) == id:
-                    if operation == 'get':
-                        return item
-                    elif operation == 'set':
-                        self.children[i] = new_item
-                        return
-                    elif operation == 'delete':
-                        del self.children[i]
-                        return
-
-                # Otherwise, recursively dig into that item's subtree
-                # Make sure it's not like a string
-                elif isinstance(item, Component):
-                    try:
-                        if operation == 'get':
-                            return item.__getitem__(id)
-                        elif operation == 'set':
-                            item.__setitem__(id, new_item)
-                            return
-                        elif operation == 'delete':
-                            item.__delitem__(id)
-                            return
-                    except KeyError:
-                        pass
-
-        # The end of our branch
-        # If we were in a list, then this exception will get caught
-        raise KeyError(id)
+        index = getattr(self, '_id_index', None)
+        if index is not None:
+            path = index.get(id)
+            if path is None:
+                if index.generation == _children_generation[0]:
+                    raise KeyError(id)
+            elif self._is_current_path(path, id):
+                return path[-1]
+
+        # pylint: disable=attribute-defined-outside-init, assigning-non-slot
+        self._id_index = index = _index_ids(
+            _children_items(self, ()), _IdIndex())
+        path = index.get(id)
+        if path is None:
+            raise KeyError(id)
+        return path[-1]
+
+    def _is_current_path(self, path, id):  # pylint: disable=redefined-builtin
+        node = self
+        for parent, slot in path:
+            if parent is not node:
+                return False
+            node = _get_child(parent, slot)
+        return getattr(node, 'id', None) == id
+
+    def _unindex(self, item):
+        if getattr(self, '_id_index', None) is None:
+            return
+        for item_id in _index_ids([(item, ())], {}):
+            self._id_index.pop(item_id, None)
 
     # Supply ABC methods for a MutableMapping:
     # - __getitem__
@@ -203,56 +346,89 @@ class Component(collections.MutableMapping):
 
         # A component's children can be undefined, a string, another component,
         # or a list of components.
-        return self._get_set_or_delete(id, 'get')
+        return _get_child(*self._find(id))
 
     def __setitem__(self, id, item):  # pylint: disable=redefined-builtin
         """Set an element by its ID."""
-        return self._get_set_or_delete(id, 'set', item)
+        parent, slot = self._find(id)
+        index = self._id_index
+        path = index[id]
+        current = index.generation == _children_generation[0]
+        self._unindex(_get_child(parent, slot))
+
+        if slot is None:
+            parent.children = item
+        else:
+            parent.children[slot] = item
+
+        _index_ids([(item, path)], index)
+        if current:
+            # The index follows its own assignment.
+            index.generation = _children_generation[0]
 
     def __delitem__(self, id):  # pylint: disable=redefined-builtin
         """Delete items by ID in the tree of children."""
-        return self._get_set_or_delete(id, 'delete')
-
-    def traverse(self):
-        """Yield each item in the tree."""
-        for t in self.traverse_with_paths():
-            yield t[1]
-
-    def traverse_with_paths(self):
-        """Yield each item with its path in the tree."""
-        children = getattr(self, 'children', None)
-        children_type = type(children).__name__
-        children_id = "(id={:s})".format(children.id) \
-                      if getattr(children, 'id', False) else ''
-        children_string = children_type + ' ' + children_id
-
-        # children is just a component
-        if isinstance(children, Component):
-            yield "[*] " + children_string, children
-            for p, t in children.traverse_with_paths():
-                yield "\n".join(["[*] " + children_string, p]), t
-
-        # children is a list of components
-        elif isinstance(children, (tuple, collections.MutableSequence)):
-            for idx, i in enumerate(children):
-                list_path = "[{:d}] {:s} {}".format(
-                    idx,
-                    type(i).__name__,
-                    "(id={:s})".format(i.id) if getattr(i, 'id', False) else ''
-                )
-                yield list_path, i
+        parent, slot = self._find(id)
+        index = self._id_index
+        current = index.generation == _children_generation[0]
+        self._unindex(_get_child(parent, slot))
+
+        if slot is None:
+            parent.children = None
+            if current:
+                index.generation = _children_generation[0]
+        else:
+            del parent.children[slot]
+            if slot < len(parent.children):
+                # The paths of the next siblings changed.
+                # pylint: disable=attribute-defined-outside-init
+                # pylint: disable=assigning-non-slot
+                self._id_index = None
+
+    def traverse(self, component_type=None, with_id=False, predicate=None):
+        """
+        Yield each item in the tree, in depth first order.
+
+        :param component_type: Only yield the instances of this class or
+            tuple of classes.
+        :param with_id: Only yield the items with an `id`.
+        :param predicate: Only yield the items for which it returns `True`.
+        """
+        return self._traverse(False, component_type, with_id, predicate)
 
-                if isinstance(i, Component):
-                    for p, t in i.traverse_with_paths():
-                        yield "\n".join([list_path, p]), t
+    def traverse_with_paths(self, component_type=None, with_id=False,
+                            predicate=None):
+        """
+        Yield each item with its path in the tree, the filters are the ones
+        of `traverse`.
+        """
+        return self._traverse(True, component_type, with_id, predicate)
+
+    def _traverse(self, with_paths, component_type, with_id, predicate):
+        # An explicit stack of the items, of `(path, item)` for
+        # `traverse_with_paths` which only builds the paths when asked.
+        stack = []
+        _push_children(stack, self, None, with_paths)
+        path = None
+        while stack:
+            item = stack.pop()
+            if with_paths:
+                path, item = item
+            matches = (
+                (component_type is None or
+                 isinstance(item, component_type)) and
+                (not with_id or getattr(item, 'id', None) is not None))
+            if matches and (predicate is None or predicate(item)):
+                yield (path, item) if with_paths else item
+            # The children are read after the item was yielded, as changed
+            # by the caller.
+            if isinstance(item, Component):
+                _push_children(stack, item, path, with_paths)
 
     def __iter__(self):
         """Yield IDs in the tree of children."""
-        for t in self.traverse():
-            if (isinstance(t, Component) and
-                    getattr(t, 'id', None) is not None):
-
-                yield t.id
+        for t in self._traverse(False, Component, True, None):
+            yield t.id
 
     def __len__(self):
         """Return the number of items in the tree."""
@@ -261,22 +437,24 @@ class Component(collections.MutableMapping):
         # The number of items is more intuitive but returning the number
         # of IDs matches __iter__ better.
         length = 0
-        if getattr(self, 'children', None) is None:
-            length = 0
-        elif isinstance(self.children, Component):
-            length = 1
-            length += len(self.children)
-        elif isinstance(self.children, (tuple, collections.MutableSequence)):
-            for c in self.children:
+        stack = [self]
+        while stack:
+            children = getattr(stack.pop(), 'children', None)
+            if isinstance(children, Component):
+                length += 1
+                stack.append(children)
+            elif isinstance(children, (tuple, collections.MutableSequence)):
+                length += len(children)
+                stack.extend(
+                    c for c in children if isinstance(c, Component))
+            elif children is not None:
+                # string or number
                 length += 1
-                if isinstance(c, Component):
-                    length += len(c)
-        else:
-            # string or number
-            length = 1
         return length
 
 
+# Used by the components generated before the explicit arguments were
+# checked in their `__init__`.
 def _explicitize_args(func):
     # Python 2
     if hasattr(func, 'func_code'):
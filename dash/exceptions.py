@@ -46,10 +46,18 @@ class CantHaveMultipleOutputs(CallbackException):
     pass
 
 
+class DuplicateCallbackOutput(CantHaveMultipleOutputs):
+    pass
+
+
 class PreventUpdate(CallbackException):
     pass
 
 
+class CallbackCancelled(CallbackException):
+    pass
+
+
 class DuplicateIdError(DashException):
     pass
 
@@ -58,6 +66,14 @@ class InvalidCallbackReturnValue(CallbackException):
     pass
 
 
+class MissingCallbackArgument(CallbackException):
+    pass
+
+
+class UnknownCallback(CallbackException):
+    pass
+
+
 class InvalidConfig(DashException):
     pass
 
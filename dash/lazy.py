@@ -0,0 +1,46 @@
+from .development.base_component import Component
+
+
+class Lazy(Component):  # pylint: disable=too-many-ancestors
+    """
+    A container component whose children are left out of the layout sent to
+    the browser, e.g. the content of a tab::
+
+        dcc.Tab(label='Report', children=Lazy(html.Div(report, id='report')))
+
+    The container is sent without its children and marked with a `lazy`
+    key, which the renderer ignores as it only reads the `type`, `namespace`
+    and `props` of the components::
+
+        {"type": "Div", "namespace": "dash_html_components",
+         "props": {"id": "report"}, "lazy": true}
+
+    The children are served by `_dash-layout-subtree/<id>` with the id of
+    the container when they are first needed. They stay in the layout of the
+    app so the callbacks can target their ids.
+
+    :param children: The container, a component with an id.
+    """
+
+    _prop_names = ['children']
+    _type = 'Lazy'
+    _namespace = 'dash'
+    _valid_wildcard_attributes = []
+    available_properties = ['children']
+    available_wildcard_properties = []
+
+    def __init__(self, children=None, **kwargs):
+        if (not isinstance(children, Component) or
+                getattr(children, 'id', None) is None):
+            raise TypeError(
+                'The children of `Lazy` must be a component with an id, '
+                'got `{}`.'.format(repr(children)))
+        super(Lazy, self).__init__(children=children, **kwargs)
+
+    def to_plotly_json(self):
+        as_json = self.children.to_plotly_json()  # pylint: disable=no-member
+        as_json['props'] = {
+            k: v for k, v in as_json['props'].items() if k != 'children'
+        }
+        as_json['lazy'] = True
+        return as_json
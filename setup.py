@@ -21,6 +21,7 @@ setup(
         'flask-compress',
         'plotly',
         'dash_renderer',
+        'futures; python_version < "3"',
     ],
     entry_points={
         'console_scripts': [
@@ -0,0 +1,51 @@
+"""
+Benchmark of the construction of the generated components.
+
+Compares the `html.Div` of `dash_html_components`, generated with the
+`_explicitize_args` wrapper, against the same component generated from its
+metadata by the current `generate_class`, which checks each argument against
+`Component.UNDEFINED` instead.
+
+    PYTHONPATH=. python tests/benchmarks/component_init.py
+"""
+import json
+import os
+import timeit
+
+import dash_html_components as html
+
+from dash.development._py_components_generation import generate_class
+
+
+def generated_div():
+    path = os.path.join(os.path.dirname(html.__file__), 'metadata.json')
+    with open(path) as f:
+        metadata = json.load(f)
+    div = next(
+        component for name, component in metadata.items()
+        if name.endswith('/Div.react.js'))
+    return generate_class(
+        'Div', div['props'], div['description'], 'dash_html_components')
+
+
+def construct(cls, count):
+    for i in range(count):
+        cls(children=i, id='id', className='row', **{'data-i': i})
+
+
+def main():
+    classes = (('previous', html.Div), ('current', generated_div()))
+    for count in (2000, 20000):
+        timings = {}
+        for name, cls in classes:
+            timings[name] = min(timeit.repeat(
+                lambda: construct(cls, count), number=1, repeat=5))
+
+        print('{:>6} components: previous {:.3f}s, current {:.3f}s, '
+              'x{:.2f}'.format(count, timings['previous'],
+                               timings['current'],
+                               timings['previous'] / timings['current']))
+
+
+if __name__ == '__main__':
+    main()
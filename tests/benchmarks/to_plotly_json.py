@@ -0,0 +1,75 @@
+"""
+Benchmark of `Component.to_plotly_json` on large layouts.
+
+Compares the serialization of trees of 10k to 100k components with the
+tracked props against the previous implementation, which looked up every
+prop name and scanned the `__dict__` for the wildcard props.
+
+    PYTHONPATH=. python tests/benchmarks/to_plotly_json.py
+"""
+import json
+import timeit
+
+import plotly
+import dash_core_components as dcc
+import dash_html_components as html
+
+from dash.development.base_component import Component
+
+
+def previous_to_plotly_json(self):
+    props = {
+        p: getattr(self, p)
+        for p in self._prop_names
+        if hasattr(self, p)
+    }
+    props.update({
+        k: getattr(self, k)
+        for k in self.__dict__
+        if any(k.startswith(w) for w in self._valid_wildcard_attributes)
+    })
+    return {
+        'props': props,
+        'type': self._type,
+        'namespace': self._namespace
+    }
+
+
+def make_layout(rows):
+    return html.Div([
+        html.Div([
+            html.Span('row {}'.format(i), className='label'),
+            dcc.Input(id='input-{}'.format(i), value=i, type='number'),
+            html.Button('ok', id='button-{}'.format(i), n_clicks=0,
+                        **{'data-row': i}),
+            html.Div([html.B('a'), html.I('b')], style={'color': 'red'}),
+        ], id='row-{}'.format(i))
+        for i in range(rows)
+    ], id='root')
+
+
+def serialize(layout):
+    return json.dumps(layout, cls=plotly.utils.PlotlyJSONEncoder)
+
+
+def main():
+    current = Component.to_plotly_json
+    for rows in (1000, 5000, 12500):
+        layout = make_layout(rows)
+        nodes = len(list(layout.traverse()))
+
+        timings = {}
+        for name, method in (('previous', previous_to_plotly_json),
+                             ('current', current)):
+            Component.to_plotly_json = method
+            timings[name] = min(
+                timeit.repeat(lambda: serialize(layout), number=1, repeat=3))
+        Component.to_plotly_json = current
+
+        print('{:>7} nodes: previous {:.3f}s, current {:.3f}s, x{:.2f}'.format(
+            nodes, timings['previous'], timings['current'],
+            timings['previous'] / timings['current']))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,6 @@
 # AUTO GENERATED FILE - DO NOT EDIT
 
-from dash.development.base_component import Component, _explicitize_args
+from dash.development.base_component import Component
 
 
 class Table(Component):
@@ -38,26 +38,55 @@ Those keys have the following types:
 - id (string; optional)
 
 Available events: 'restyle', 'relayout', 'click'"""
-    @_explicitize_args
-    def __init__(self, children=None, optionalArray=Component.UNDEFINED, optionalBool=Component.UNDEFINED, optionalFunc=Component.UNDEFINED, optionalNumber=Component.UNDEFINED, optionalObject=Component.UNDEFINED, optionalString=Component.UNDEFINED, optionalSymbol=Component.UNDEFINED, optionalNode=Component.UNDEFINED, optionalElement=Component.UNDEFINED, optionalMessage=Component.UNDEFINED, optionalEnum=Component.UNDEFINED, optionalUnion=Component.UNDEFINED, optionalArrayOf=Component.UNDEFINED, optionalObjectOf=Component.UNDEFINED, optionalObjectWithShapeAndNestedDescription=Component.UNDEFINED, optionalAny=Component.UNDEFINED, customProp=Component.UNDEFINED, customArrayProp=Component.UNDEFINED, id=Component.UNDEFINED, **kwargs):
-        self._prop_names = ['children', 'optionalArray', 'optionalBool', 'optionalNumber', 'optionalObject', 'optionalString', 'optionalNode', 'optionalElement', 'optionalEnum', 'optionalUnion', 'optionalArrayOf', 'optionalObjectOf', 'optionalObjectWithShapeAndNestedDescription', 'optionalAny', 'customProp', 'customArrayProp', 'data-*', 'aria-*', 'in', 'id']
-        self._type = 'Table'
-        self._namespace = 'TableComponents'
-        self._valid_wildcard_attributes =            ['data-', 'aria-']
-        self.available_events = ['restyle', 'relayout', 'click']
-        self.available_properties = ['children', 'optionalArray', 'optionalBool', 'optionalNumber', 'optionalObject', 'optionalString', 'optionalNode', 'optionalElement', 'optionalEnum', 'optionalUnion', 'optionalArrayOf', 'optionalObjectOf', 'optionalObjectWithShapeAndNestedDescription', 'optionalAny', 'customProp', 'customArrayProp', 'data-*', 'aria-*', 'in', 'id']
-        self.available_wildcard_properties =            ['data-', 'aria-']
-
-        _explicit_args = kwargs.pop('_explicit_args')
-        _locals = locals()
-        _locals.update(kwargs)  # For wildcard attrs
-        args = {k: _locals[k] for k in _explicit_args if k != 'children'}
+    __slots__ = ('children', 'optionalArray', 'optionalBool', 'optionalNumber', 'optionalObject', 'optionalString', 'optionalNode', 'optionalElement', 'optionalEnum', 'optionalUnion', 'optionalArrayOf', 'optionalObjectOf', 'optionalObjectWithShapeAndNestedDescription', 'optionalAny', 'customProp', 'customArrayProp', 'id')
+    _prop_names = ['children', 'optionalArray', 'optionalBool', 'optionalNumber', 'optionalObject', 'optionalString', 'optionalNode', 'optionalElement', 'optionalEnum', 'optionalUnion', 'optionalArrayOf', 'optionalObjectOf', 'optionalObjectWithShapeAndNestedDescription', 'optionalAny', 'customProp', 'customArrayProp', 'data-*', 'aria-*', 'in', 'id']
+    _type = 'Table'
+    _namespace = 'TableComponents'
+    _valid_wildcard_attributes = ['data-', 'aria-']
+    available_events = ['restyle', 'relayout', 'click']
+    available_properties = ['children', 'optionalArray', 'optionalBool', 'optionalNumber', 'optionalObject', 'optionalString', 'optionalNode', 'optionalElement', 'optionalEnum', 'optionalUnion', 'optionalArrayOf', 'optionalObjectOf', 'optionalObjectWithShapeAndNestedDescription', 'optionalAny', 'customProp', 'customArrayProp', 'data-*', 'aria-*', 'in', 'id']
+    available_wildcard_properties = ['data-', 'aria-']
 
-        for k in []:
-            if k not in args:
-                raise TypeError(
-                    'Required argument `' + k + '` was not specified.')
-        super(Table, self).__init__(children=children, **args)
+    def __init__(self, children=None, optionalArray=Component.UNDEFINED, optionalBool=Component.UNDEFINED, optionalFunc=Component.UNDEFINED, optionalNumber=Component.UNDEFINED, optionalObject=Component.UNDEFINED, optionalString=Component.UNDEFINED, optionalSymbol=Component.UNDEFINED, optionalNode=Component.UNDEFINED, optionalElement=Component.UNDEFINED, optionalMessage=Component.UNDEFINED, optionalEnum=Component.UNDEFINED, optionalUnion=Component.UNDEFINED, optionalArrayOf=Component.UNDEFINED, optionalObjectOf=Component.UNDEFINED, optionalObjectWithShapeAndNestedDescription=Component.UNDEFINED, optionalAny=Component.UNDEFINED, customProp=Component.UNDEFINED, customArrayProp=Component.UNDEFINED, id=Component.UNDEFINED, **kwargs):
+        if optionalArray is not Component.UNDEFINED:
+            kwargs['optionalArray'] = optionalArray
+        if optionalBool is not Component.UNDEFINED:
+            kwargs['optionalBool'] = optionalBool
+        if optionalFunc is not Component.UNDEFINED:
+            kwargs['optionalFunc'] = optionalFunc
+        if optionalNumber is not Component.UNDEFINED:
+            kwargs['optionalNumber'] = optionalNumber
+        if optionalObject is not Component.UNDEFINED:
+            kwargs['optionalObject'] = optionalObject
+        if optionalString is not Component.UNDEFINED:
+            kwargs['optionalString'] = optionalString
+        if optionalSymbol is not Component.UNDEFINED:
+            kwargs['optionalSymbol'] = optionalSymbol
+        if optionalNode is not Component.UNDEFINED:
+            kwargs['optionalNode'] = optionalNode
+        if optionalElement is not Component.UNDEFINED:
+            kwargs['optionalElement'] = optionalElement
+        if optionalMessage is not Component.UNDEFINED:
+            kwargs['optionalMessage'] = optionalMessage
+        if optionalEnum is not Component.UNDEFINED:
+            kwargs['optionalEnum'] = optionalEnum
+        if optionalUnion is not Component.UNDEFINED:
+            kwargs['optionalUnion'] = optionalUnion
+        if optionalArrayOf is not Component.UNDEFINED:
+            kwargs['optionalArrayOf'] = optionalArrayOf
+        if optionalObjectOf is not Component.UNDEFINED:
+            kwargs['optionalObjectOf'] = optionalObjectOf
+        if optionalObjectWithShapeAndNestedDescription is not Component.UNDEFINED:
+            kwargs['optionalObjectWithShapeAndNestedDescription'] = optionalObjectWithShapeAndNestedDescription
+        if optionalAny is not Component.UNDEFINED:
+            kwargs['optionalAny'] = optionalAny
+        if customProp is not Component.UNDEFINED:
+            kwargs['customProp'] = customProp
+        if customArrayProp is not Component.UNDEFINED:
+            kwargs['customArrayProp'] = customArrayProp
+        if id is not Component.UNDEFINED:
+            kwargs['id'] = id
+        super(Table, self).__init__(children=children, **kwargs)
 
     def __repr__(self):
         if(any(getattr(self, c, None) is not None
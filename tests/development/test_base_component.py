@@ -1,9 +1,12 @@
 from collections import OrderedDict
 import collections
+import copy
 import inspect
 import json
 import os
+import pickle
 import shutil
+import sys
 import unittest
 import plotly
 
@@ -161,6 +164,45 @@ class TestComponent(unittest.TestCase):
             list(c.children) + [c3] + [c2] + list(c2.children)
         )
 
+    def test_traverse_with_paths(self):
+        c, c1, c2, c3, c4, c5 = nested_tree()
+        paths = dict((id(t), p) for p, t in c.traverse_with_paths())
+        self.assertEqual(paths[id(c5)], '[0] Component (id=0.0)')
+        self.assertEqual(
+            paths[id(c1)],
+            '[1] Component (id=0.1)\n'
+            '[*] Component (id=0.1.x)\n'
+            '[*] Component (id=0.1.x.x)\n'
+            '[3] Component (id=0.1.x.x.0)')
+        self.assertEqual(
+            paths[id(c2.children[2])],
+            '[1] Component (id=0.1)\n'
+            '[*] Component (id=0.1.x)\n'
+            '[*] Component (id=0.1.x.x)\n'
+            '[2] str ')
+
+    def test_traverse_filters(self):
+        c, c1, c2, c3, c4, c5 = nested_tree()
+        self.assertEqual(list(c.traverse(component_type=Component)),
+                         [c5, c4, c3, c2, c1])
+        self.assertEqual(list(c.traverse(component_type=(int, float))),
+                         [10, 4.51])
+        c3.id = None
+        self.assertEqual(list(c.traverse(with_id=True)), [c5, c4, c2, c1])
+        self.assertEqual(
+            [p for p, _ in c.traverse_with_paths(
+                predicate=lambda t: t is c2)],
+            ['[1] Component (id=0.1)\n[*] Component \n'
+             '[*] Component (id=0.1.x.x)'])
+
+    def test_traverse_deep_tree(self):
+        c = leaf = Component(id='leaf')
+        for _ in range(5000):
+            c = Component(children=c)
+        self.assertEqual(list(c.traverse(with_id=True)), [leaf])
+        self.assertEqual(len(c), 5000)
+        self.assertEqual(list(c), ['leaf'])
+
     def test_iter_with_nested_children_with_mixed_strings_and_without_lists(self):  # noqa: E501
         c = nested_tree()[0]
         keys = list(c.keys())
@@ -496,6 +538,139 @@ class TestComponent(unittest.TestCase):
         self.assertTrue('2' not in c)
         self.assertTrue(c2_popped is c2)
 
+    def test_id_index(self):
+        c, c1, c2, c3, c4, c5 = nested_tree()
+        self.assertTrue(c['0.1.x.x.0'] is c1)
+        index = c._id_index
+        self.assertEqual(
+            sorted(index), ['0.0', '0.1', '0.1.x', '0.1.x.x', '0.1.x.x.0'])
+
+        # Reused by the next lookups.
+        self.assertTrue(c['0.0'] is c5)
+        self.assertTrue('0.1.x' in c)
+        self.assertTrue(c._id_index is index)
+
+        # Updated by the mapping API.
+        new = Component(id='new', children=[Component(id='new.0')])
+        c['0.1.x.x'] = new
+        self.assertTrue(c._id_index is index)
+        self.assertTrue('0.1.x.x.0' not in c)
+        self.assertTrue(c['new.0'] is new.children[0])
+        self.assertTrue(c3.children is new)
+
+        del c['new']
+        self.assertTrue('new.0' not in c)
+        self.assertTrue(c3.children is None)
+
+    def test_id_index_after_direct_changes(self):
+        c, c1, c2, c3, c4, c5 = nested_tree()
+        self.assertTrue(c['0.1.x.x.0'] is c1)
+
+        # Changes made without the mapping API.
+        c.children.reverse()
+        c2.children = [Component(id='moved', children=c1)]
+        self.assertTrue(c['0.1.x.x.0'] is c1)
+        self.assertTrue(c['moved'] is c2.children[0])
+        c.children.pop()
+        self.assertRaises(KeyError, c.__getitem__, '0.0')
+
+    def test_id_index_misses(self):
+        c, c1, c2, c3, c4, c5 = nested_tree()
+        indexes = []
+
+        def lookup(id):
+            found = id in c
+            if not indexes or c._id_index is not indexes[-1]:
+                indexes.append(c._id_index)
+            return found
+
+        # The misses are answered by the index.
+        for _ in range(10):
+            self.assertFalse(lookup('absent'))
+        self.assertEqual(len(indexes), 1)
+
+        # Updated by the mapping API.
+        c['0.1.x.x'] = Component(id='new', children=Component(id='new.0'))
+        del c['new.0']
+        for _ in range(10):
+            self.assertFalse(lookup('absent'))
+            self.assertFalse(lookup('0.1.x.x.0'))
+        self.assertEqual(len(indexes), 1)
+
+        # Rebuilt once after an assignment of children.
+        c5.children = Component(id='added')
+        self.assertTrue(lookup('added'))
+        for _ in range(10):
+            self.assertFalse(lookup('absent'))
+        self.assertEqual(len(indexes), 2)
+
+    def test_del_item_shifts_the_next_siblings(self):
+        items = [Component(id=str(i)) for i in range(5)]
+        c = Component(id='root', children=list(items))
+        self.assertTrue(c['4'] is items[4])
+        del c['1']
+        del c['3']
+        self.assertEqual(list(c), ['0', '2', '4'])
+        self.assertTrue(c['4'] is items[4])
+        c['2'] = Component(id='two')
+        self.assertEqual(list(c), ['0', 'two', '4'])
+
+    def test_to_plotly_json_tracks_set_props(self):
+        c = Component(**{'data-b': 1, 'children': 'x', 'data-a': 2})
+        c.id = 'c'
+        c.not_a_prop = True
+        props = list(c.to_plotly_json()['props'])
+        if sys.version_info >= (3, 6):
+            # Ordered as the prop names, then the wildcards as they're set.
+            self.assertEqual(props, ['id', 'children', 'data-b', 'data-a'])
+        else:
+            self.assertEqual(sorted(props),
+                             ['children', 'data-a', 'data-b', 'id'])
+
+        del c.children
+        self.assertEqual(c.to_plotly_json()['props'],
+                         {'id': 'c', 'data-b': 1, 'data-a': 2})
+
+        # The props of the class are read again when they change.
+        c._prop_names = ('children',)
+        c.children = 'y'
+        self.assertEqual(c.to_plotly_json()['props'],
+                         {'children': 'y', 'data-b': 1, 'data-a': 2})
+
+    def test_pickle(self):
+        from tests.development.metadata_test import Table
+        components = [
+            Component(id='c', children=[Component(id='d')],
+                      **{'data-a': 1}),
+            Table(id='t', optionalBool=False, **{'data-a': 1, 'aria-b': 2})
+        ]
+        for component in components:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                loaded = pickle.loads(pickle.dumps(component, protocol))
+                self.assertEqual(type(loaded), type(component))
+                self.assertEqual(
+                    json.dumps(loaded, cls=plotly.utils.PlotlyJSONEncoder,
+                               sort_keys=True),
+                    json.dumps(component, cls=plotly.utils.PlotlyJSONEncoder,
+                               sort_keys=True))
+
+        loaded = pickle.loads(pickle.dumps(components[0], 0))
+        loaded.title = 'x'
+        self.assertTrue(loaded['d'] is loaded.children[0])
+        self.assertNotIn('title', components[0].to_plotly_json()['props'])
+
+    def test_copy_tracks_its_own_set_props(self):
+        c = Component(id='c', **{'data-a': 1})
+        c.not_a_prop = True
+        copied = copy.copy(c)
+        copied.children = 'x'
+        del copied.id
+        self.assertEqual(c.to_plotly_json()['props'],
+                         {'id': 'c', 'data-a': 1})
+        self.assertEqual(copied.to_plotly_json()['props'],
+                         {'children': 'x', 'data-a': 1})
+        self.assertTrue(copied.not_a_prop)
+
 
 class TestGenerateClassFile(unittest.TestCase):
     def setUp(self):
@@ -513,8 +688,7 @@ class TestGenerateClassFile(unittest.TestCase):
         # Import string not included in generated class string
         import_string =\
             "# AUTO GENERATED FILE - DO NOT EDIT\n\n" + \
-            "from dash.development.base_component import" + \
-            " Component, _explicitize_args\n\n\n"
+            "from dash.development.base_component import Component\n\n\n"
 
         # Class string generated from generate_class_string
         self.component_class_string = import_string + generate_class_string(
@@ -635,6 +809,27 @@ class TestGenerateClass(unittest.TestCase):
         for k, v in list(kwargs.items()):
             self.assertEqual(getattr(component_instance, k), v)
 
+    def test_props_stored_in_slots(self):
+        c = self.ComponentClass(
+            'text children', id='my-id', optionalBool=False,
+            **{'data-x': 1, 'in': 'keyword'})
+        self.assertIn('optionalBool', self.ComponentClass.__slots__)
+        self.assertNotIn('data-*', self.ComponentClass.__slots__)
+        # Only the wildcard props and the keywords use the `__dict__`.
+        self.assertEqual(vars(c), {'data-x': 1, 'in': 'keyword'})
+        self.assertEqual(c.optionalBool, False)
+        self.assertFalse(hasattr(c, 'optionalArray'))
+        self.assertEqual(
+            c.to_plotly_json()['props'],
+            {'children': 'text children', 'id': 'my-id',
+             'optionalBool': False, 'data-x': 1, 'in': 'keyword'})
+
+        # The metadata is shared by the instances.
+        self.assertNotIn('_prop_names', vars(c))
+        self.assertIs(
+            c.available_properties,
+            self.ComponentClass('other').available_properties)
+
     def test_repr_single_default_argument(self):
         c1 = self.ComponentClass('text children')
         c2 = self.ComponentClass(children='text children')
@@ -718,23 +913,20 @@ class TestGenerateClass(unittest.TestCase):
              'optionalAny',
              'customProp',
              'customArrayProp',
-             'id'] if hasattr(inspect, 'signature') else []
-
-
+             'id']
         )
         self.assertEqual(
             inspect.getargspec(__init__func).varargs,
-            None if hasattr(inspect, 'signature') else 'args'
+            None
         )
         self.assertEqual(
             inspect.getargspec(__init__func).keywords,
             'kwargs'
         )
-        if hasattr(inspect, 'signature'):
-            self.assertEqual(
-                [str(x) for x in inspect.getargspec(__init__func).defaults],
-                ['None'] + ['undefined'] * 19
-            )
+        self.assertEqual(
+            [str(x) for x in inspect.getargspec(__init__func).defaults],
+            ['None'] + ['undefined'] * 19
+        )
 
     def test_required_props(self):
         with self.assertRaises(Exception):
@@ -745,6 +937,27 @@ class TestGenerateClass(unittest.TestCase):
         with self.assertRaises(Exception):
             self.ComponentClassRequired(children='test')
 
+    def test_init_with_explicitize_args(self):
+        # The `__init__` of the components generated before, see
+        # tests/benchmarks/component_init.py for their construction time.
+        class Wrapped(self.ComponentClass):
+            __slots__ = ()
+
+            @_explicitize_args
+            def __init__(self, children=None, optionalBool=Component.UNDEFINED,
+                         id=Component.UNDEFINED, **kwargs):
+                _explicit_args = kwargs.pop('_explicit_args')
+                _locals = locals()
+                _locals.update(kwargs)
+                args = {k: _locals[k] for k in _explicit_args
+                        if k != 'children'}
+                Component.__init__(self, children=children, **args)
+
+        c = Wrapped(id='id', optionalBool=False)
+        self.assertEqual(c.to_plotly_json(),
+                         self.ComponentClass(id='id', optionalBool=False)
+                         .to_plotly_json())
+
 
 class TestMetaDataConversions(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,159 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from dash import caching
+from dash import exceptions
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_get_set(self):
+        cache = caching.MemoryCache()
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', '{"a": 1}')
+        self.assertEqual(cache.get('a'), '{"a": 1}')
+        self.assertEqual(cache.info()['hits'], 1)
+        self.assertEqual(cache.info()['misses'], 1)
+
+    def test_lru_eviction(self):
+        cache = caching.MemoryCache(max_size=10)
+        cache.set('a', 'aaaa')
+        cache.set('b', 'bbbb')
+        # Use `a` so that `b` is the least recently used.
+        cache.get('a')
+        cache.set('c', 'cccc')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'aaaa')
+        self.assertEqual(cache.get('c'), 'cccc')
+        self.assertEqual(cache.info()['evictions'], 1)
+        self.assertEqual(cache.info()['size'], 8)
+
+    def test_too_large_values_are_not_stored(self):
+        cache = caching.MemoryCache(max_size=2)
+        cache.set('a', 'aaaa')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.info()['size'], 0)
+
+    def test_ttl(self):
+        cache = caching.MemoryCache(ttl=0.05)
+        cache.set('a', 'aaaa')
+        self.assertEqual(cache.get('a'), 'aaaa')
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.info()['entries'], 0)
+
+    def test_callback_key(self):
+        self.assertEqual(
+            caching.callback_key('out.children', [{'a': 1, 'b': 2}]),
+            caching.callback_key('out.children', ({'b': 2, 'a': 1},))
+        )
+        self.assertNotEqual(
+            caching.callback_key('out.children', [1]),
+            caching.callback_key('out.value', [1])
+        )
+
+    def test_make_cache(self):
+        self.assertIsNone(caching.make_cache(None))
+        self.assertIsInstance(caching.make_cache(True), caching.MemoryCache)
+        self.assertEqual(caching.make_cache({'ttl': 3}).ttl, 3)
+        cache = caching.MemoryCache()
+        self.assertIs(caching.make_cache(cache), cache)
+        tiered = caching.make_cache([cache, caching.MemoryCache()])
+        self.assertIsInstance(tiered, caching.TieredCache)
+        self.assertIs(tiered.caches[0], cache)
+        self.assertRaises(
+            exceptions.IncorrectTypeException, caching.make_cache, 'yes')
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_get_set(self):
+        cache = caching.DiskCache(self.directory)
+        self.assertIsNone(cache.get('aa01'))
+        cache.set('aa01', '{"a": 1}')
+        cache.set('aa02', '')
+        self.assertEqual(cache.get('aa01'), '{"a": 1}')
+        self.assertEqual(cache.get('aa02'), '')
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.directory, 'aa', 'aa01')))
+
+        # Another worker or a restarted one.
+        other = caching.DiskCache(self.directory)
+        self.assertEqual(other.get('aa01'), '{"a": 1}')
+
+        other.delete('aa01')
+        self.assertIsNone(cache.get('aa01'))
+        cache.clear()
+        self.assertIsNone(cache.get('aa02'))
+        self.assertEqual(
+            cache.info(),
+            {'hits': 2, 'misses': 3, 'evictions': 0, 'entries': 0,
+             'size': 0, 'max_size': 1024 * 1024 * 1024}
+        )
+
+    def test_lru_eviction(self):
+        cache = caching.DiskCache(self.directory, max_size=10)
+        cache.set('aa', 'aaaa')
+        cache.set('bb', 'bbbb')
+        time.sleep(0.01)
+        # Use `aa` so that `bb` is the least recently used.
+        cache.get('aa')
+        cache.set('cc', 'cccc')
+
+        self.assertIsNone(cache.get('bb'))
+        self.assertEqual(cache.get('aa'), 'aaaa')
+        self.assertEqual(cache.get('cc'), 'cccc')
+        self.assertEqual(cache.info()['evictions'], 1)
+        self.assertEqual(cache.info()['size'], 8)
+
+    def test_ttl(self):
+        cache = caching.DiskCache(self.directory, ttl=0.05)
+        cache.set('aa', 'aaaa')
+        self.assertEqual(cache.get('aa'), 'aaaa')
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('aa'))
+        self.assertEqual(cache.info()['entries'], 0)
+
+
+class TestTieredCache(unittest.TestCase):
+    def test_promotion(self):
+        memory = caching.MemoryCache()
+        slow = caching.MemoryCache()
+        cache = caching.TieredCache(memory, slow)
+
+        slow.set('a', 'aaaa')
+        self.assertEqual(cache.get('a'), 'aaaa')
+        self.assertEqual(memory.get('a'), 'aaaa')
+        self.assertIsNone(cache.get('b'))
+
+        cache.set('b', 'bbbb')
+        self.assertEqual(slow.get('b'), 'bbbb')
+        self.assertEqual(cache.info()['hits'], 1)
+        self.assertEqual(cache.info()['misses'], 1)
+        self.assertEqual(len(cache.info()['tiers']), 2)
+
+
+class TestGenerations(unittest.TestCase):
+    def test_local(self):
+        generations = caching.Generations()
+        self.assertEqual(generations.get('tag:a'), 0)
+        generations.bump('tag:a')
+        generations.bump('tag:a')
+        self.assertEqual(generations.get('tag:a'), 2)
+        self.assertEqual(generations.get('tag:b'), 0)
+
+    def test_shared_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        generations = caching.Generations(directory)
+        other = caching.Generations(directory)
+
+        generations.bump('tag:a')
+        self.assertEqual(other.get('tag:a'), 1)
+        self.assertEqual(other.get('tag:b'), 0)
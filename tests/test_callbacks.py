@@ -0,0 +1,888 @@
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+
+import mock
+import dash_core_components as dcc
+from dash_html_components import Div
+
+import dash
+from dash.dependencies import Input, Output, State
+from dash import exceptions
+from dash._single_flight import SingleFlight
+
+
+class TestDispatch(unittest.TestCase):
+    def setUp(self):
+        self.app = dash.Dash('my-app')
+        self.app.layout = Div([
+            dcc.Input(id='input-1'),
+            dcc.Input(id='input-2'),
+            Div(id='output')
+        ], id='body')
+        self.app.server.testing = True
+        self.client = self.app.server.test_client()
+
+    def post(self, body, url='/_dash-update-component'):
+        return self.client.post(
+            url,
+            headers={'Content-Type': 'application/json'},
+            data=json.dumps(body)
+        )
+
+    def test_arguments_bound_in_registration_order(self):
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-2', 'value'), Input('input-1', 'value')],
+            [State('input-1', 'placeholder')])
+        def update_output(value2, value1, placeholder):
+            return '{} {} {}'.format(value2, value1, placeholder)
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 'a'},
+                {'id': 'input-2', 'property': 'value', 'value': 'b'},
+            ],
+            'state': [
+                {'id': 'input-1', 'property': 'placeholder', 'value': 'c'}
+            ]
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.data),
+            {'response': {'props': {'children': 'b a c'}}}
+        )
+
+    def test_missing_argument(self):
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value'), Input('input-2', 'value')])
+        def update_output(value1, value2):
+            return value1
+
+        with self.app.server.test_request_context(
+                '/_dash-update-component',
+                method='POST',
+                json={
+                    'output': {'id': 'output', 'property': 'children'},
+                    'inputs': [
+                        {'id': 'input-1', 'property': 'value', 'value': 1}
+                    ]
+                }):
+            self.assertRaises(
+                exceptions.MissingCallbackArgument, self.app.dispatch)
+
+    def test_memoize(self):
+        calls = []
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            memoize=True)
+        def update_output(value):
+            calls.append(value)
+            return value
+
+        def request(value):
+            return self.post({
+                'output': {'id': 'output', 'property': 'children'},
+                'inputs': [
+                    {'id': 'input-1', 'property': 'value', 'value': value}
+                ]
+            })
+
+        first = request('a')
+        second = request('a')
+        request('b')
+
+        self.assertEqual(calls, ['a', 'b'])
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(
+            self.app.cache_info()['output.children'],
+            {'hits': 1, 'misses': 2, 'evictions': 0, 'entries': 2,
+             'size': len(first.data) * 2, 'max_size': 64 * 1024 * 1024}
+        )
+
+    def test_batch(self):
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')])
+        def update_output(value):
+            if value is None:
+                raise exceptions.PreventUpdate
+            return value
+
+        @self.app.callback(
+            Output('input-2', 'placeholder'),
+            [Input('input-1', 'value')])
+        def update_placeholder(value):
+            return 1.0 / value
+
+        def request(output, value):
+            return {
+                'output': {'id': output[0], 'property': output[1]},
+                'inputs': [
+                    {'id': 'input-1', 'property': 'value', 'value': value}
+                ]
+            }
+
+        response = self.post([
+            request(('output', 'children'), 3),
+            request(('output', 'children'), None),
+            request(('input-2', 'placeholder'), 0),
+            request(('input-2', 'placeholder'), 4),
+        ], url='/_dash-update-component-batch')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), [
+            {'status': 200,
+             'response': {'response': {'props': {'children': 3}}}},
+            {'status': 204},
+            {'status': 500},
+            {'status': 200,
+             'response': {'response': {'props': {'placeholder': 0.25}}}},
+        ])
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'requires async def')
+    def test_coroutine_callback(self):
+        namespace = {'threading': threading}
+        exec(textwrap.dedent('''
+            import asyncio
+
+            async def update_output(value):
+                await asyncio.sleep(0.01)
+                return threading.current_thread().name, value
+        '''), namespace)
+
+        self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')])(namespace['update_output'])
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 'a'}
+            ]
+        })
+        thread_name, value = json.loads(
+            response.data)['response']['props']['children']
+        self.assertEqual(value, 'a')
+        self.assertNotEqual(thread_name, threading.current_thread().name)
+
+    def test_background_callback(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            background=True)
+        def update_output(value):
+            self.app.set_progress(50)
+            started.set()
+            release.wait(5)
+            return value
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 'a'}
+            ]
+        })
+        self.assertEqual(response.status_code, 202)
+        job_url = '/_dash-job/' + json.loads(response.data)['job']
+
+        started.wait(5)
+        self.assertEqual(
+            json.loads(self.client.get(job_url).data),
+            {'status': 'running', 'progress': 50}
+        )
+
+        release.set()
+        # pylint: disable=protected-access
+        self.app._jobs._jobs[job_url.split('/')[-1]].future.result(5)
+        self.assertEqual(
+            json.loads(self.client.get(job_url).data),
+            {'status': 'done', 'progress': 50,
+             'response': {'response': {'props': {'children': 'a'}}}}
+        )
+        self.assertEqual(
+            self.client.get('/_dash-job/not-a-job').status_code, 404)
+
+    def test_cancel_background_callback(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            background=True)
+        def update_output(value):
+            started.set()
+            release.wait(5)
+            self.app.set_progress(100)
+            return value
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 'a'}
+            ]
+        })
+        job_id = json.loads(response.data)['job']
+
+        started.wait(5)
+        response = self.client.delete('/_dash-job/' + job_id)
+        self.assertEqual(json.loads(response.data)['status'], 'cancelled')
+
+        release.set()
+        # pylint: disable=protected-access
+        self.app._jobs._jobs[job_id].future.result(5)
+        self.assertEqual(
+            json.loads(self.client.get('/_dash-job/' + job_id).data),
+            {'status': 'cancelled', 'progress': None}
+        )
+
+    def test_finished_jobs_retention(self):
+        # pylint: disable=protected-access
+        # One worker, the jobs finish in the order they're submitted.
+        jobs = dash._executors.JobManager(max_workers=1, max_finished=2)
+        job_ids = [jobs.submit(lambda x: x, i) for i in range(4)]
+        for job_id in job_ids:
+            job = jobs.get(job_id)
+            if job is not None:
+                job.future.result(5)
+
+        jobs.submit(lambda: None)
+        self.assertIsNone(jobs.get(job_ids[0]))
+        self.assertIsNone(jobs.get(job_ids[1]))
+        self.assertEqual(jobs.get(job_ids[3]).result, 3)
+
+    def test_process_executor(self):
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            executor='process')
+        def update_output(value):
+            return [os.getpid(), value]
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 'a'}
+            ]
+        })
+        pid, value = json.loads(
+            response.data)['response']['props']['children']
+        self.assertEqual(value, 'a')
+        self.assertNotEqual(pid, os.getpid())
+
+        self.assertRaises(
+            exceptions.IncorrectTypeException,
+            self.app.callback,
+            Output('input-2', 'value'),
+            [Input('input-1', 'value')],
+            executor='gpu')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'no mp_context')
+    @unittest.skipIf(sys.platform == 'win32', 'no fork on Windows')
+    def test_process_executor_forks_workers(self):
+        start_method = multiprocessing.get_start_method(allow_none=True)
+        multiprocessing.set_start_method('spawn', force=True)
+        self.addCleanup(
+            multiprocessing.set_start_method, start_method, force=True)
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            executor='process')
+        def update_output(value):
+            return value
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 'a'}
+            ]
+        })
+        self.assertEqual(
+            json.loads(response.data)['response']['props']['children'], 'a')
+
+    def test_process_executor_without_fork(self):
+        with mock.patch('dash._executors._fork_pool_kwargs',
+                        return_value=None):
+            self.assertRaises(
+                exceptions.IncorrectTypeException,
+                self.app.callback(
+                    Output('output', 'children'),
+                    [Input('input-1', 'value')],
+                    executor='process'),
+                lambda value: value)
+
+    def test_multi_output(self):
+        calls = []
+
+        @self.app.callback(
+            [Output('output', 'children'), Output('input-2', 'value')],
+            [Input('input-1', 'value')])
+        def update_outputs(value):
+            calls.append(value)
+            return value, value * 2
+
+        callback_id = '..output.children...input-2.value..'
+        self.assertIn(callback_id, self.app.callback_map)
+
+        response = self.post({
+            'output': callback_id,
+            'inputs': [
+                {'id': 'input-1', 'property': 'value', 'value': 3}
+            ]
+        })
+        self.assertEqual(calls, [3])
+        self.assertEqual(json.loads(response.data), {
+            'multi': True,
+            'response': {
+                'output': {'children': 3},
+                'input-2': {'value': 6}
+            }
+        })
+
+        with self.app.server.test_request_context():
+            dependencies = json.loads(self.app.dependencies().data)
+        self.assertEqual(dependencies[0]['output'], callback_id)
+        self.assertEqual(dependencies[0]['outputs'], [
+            {'id': 'output', 'property': 'children'},
+            {'id': 'input-2', 'property': 'value'}
+        ])
+
+    def test_multi_output_validation(self):
+        self.app.callback(
+            [Output('output', 'children'), Output('input-2', 'value')],
+            [Input('input-1', 'value')])(lambda value: (value, value))
+
+        self.assertRaises(
+            exceptions.DuplicateCallbackOutput,
+            self.app.callback,
+            Output('input-2', 'value'),
+            [Input('input-1', 'value')])
+        self.assertRaises(
+            exceptions.IncorrectTypeException,
+            self.app.callback,
+            [],
+            [Input('input-1', 'value')])
+
+        @self.app.callback(
+            [Output('input-2', 'placeholder'), Output('output', 'style')],
+            [Input('input-1', 'value')])
+        def update_outputs(value):
+            return value
+
+        with self.app.server.test_request_context():
+            self.assertRaises(
+                exceptions.InvalidCallbackReturnValue,
+                update_outputs, 1)
+
+    def test_chained_callbacks(self):
+        self.app.layout = Div([
+            dcc.Input(id='a'),
+            Div(id='b'),
+            Div(id='c'),
+            Div(id='d'),
+            Div(id='e'),
+            dcc.Input(id='f'),
+        ])
+        calls = []
+
+        def register(output, inputs, state=None):
+            def update(*args):
+                calls.append(output)
+                return '{}({})'.format(output, ', '.join(map(str, args)))
+
+            self.app.callback(
+                Output(output, 'children'),
+                [Input(i, 'value' if i == 'a' else 'children')
+                 for i in inputs],
+                [State(i, 'value') for i in state or []])(update)
+
+        register('b', ['a'])
+        register('c', ['b'])
+        # `d` also waits on `c`, it's evaluated after it.
+        register('d', ['b', 'c'])
+        # The value of `f` isn't in the request.
+        register('e', ['d'], ['f'])
+
+        response = self.post({
+            'output': {'id': 'b', 'property': 'children'},
+            'inputs': [{'id': 'a', 'property': 'value', 'value': 1}],
+            'chain': True
+        })
+
+        self.assertEqual(calls, ['b', 'c', 'd'])
+        self.assertEqual(json.loads(response.data), {
+            'multi': True,
+            'resolved': ['b.children', 'c.children', 'd.children'],
+            'response': {
+                'b': {'children': 'b(1)'},
+                'c': {'children': 'c(b(1))'},
+                'd': {'children': 'd(b(1), c(b(1)))'},
+            }
+        })
+
+        # With the value of `f` in the context.
+        response = self.post({
+            'output': {'id': 'b', 'property': 'children'},
+            'inputs': [{'id': 'a', 'property': 'value', 'value': 1}],
+            'context': [{'id': 'f', 'property': 'value', 'value': 2}],
+            'chain': True
+        })
+        self.assertEqual(
+            json.loads(response.data)['response']['e'],
+            {'children': 'e(d(b(1), c(b(1))), 2)'}
+        )
+
+    def test_chained_callbacks_failure(self):
+        self.app.layout = Div([
+            dcc.Input(id='a'), Div(id='b'), Div(id='c'), Div(id='d'),
+            Div(id='e')
+        ])
+
+        def fail(value):
+            raise ValueError(value)
+
+        for output, input_id, func in (
+                ('b', 'a', lambda value: value + 1),
+                ('c', 'b', fail),
+                ('d', 'c', lambda value: value + 1),
+                ('e', 'b', lambda value: value * 10)):
+            self.app.callback(
+                Output(output, 'children'),
+                [Input(input_id, 'value' if input_id == 'a' else 'children')]
+            )(func)
+
+        self.app.server.logger.disabled = True
+        self.addCleanup(setattr, self.app.server.logger, 'disabled', False)
+        response = self.post({
+            'output': {'id': 'b', 'property': 'children'},
+            'inputs': [{'id': 'a', 'property': 'value', 'value': 1}],
+            'context': [{'id': 'c', 'property': 'children', 'value': 0}],
+            'chain': True
+        })
+
+        # `c` and `d`, which depends on it, are left for the renderer.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), {
+            'multi': True,
+            'resolved': ['b.children', 'e.children'],
+            'response': {'b': {'children': 2}, 'e': {'children': 20}}
+        })
+
+    def test_chained_callbacks_limits(self):
+        self.app.layout = Div([Div(id=str(i)) for i in range(10)])
+
+        for i in range(9):
+            self.app.callback(
+                Output(str(i + 1), 'children'),
+                [Input(str(i), 'children')])(lambda value: value + 1)
+
+        # A cycle
+        self.app.callback(
+            Output('0', 'children'),
+            [Input('9', 'children')])(lambda value: value + 1)
+
+        response = self.post({
+            'output': {'id': '1', 'property': 'children'},
+            'inputs': [{'id': '0', 'property': 'children', 'value': 0}],
+            'chain': True
+        })
+        self.assertEqual(
+            json.loads(response.data)['resolved'],
+            ['{}.children'.format(i) for i in range(1, 7)]
+        )
+
+        self.app.config.callback_chain_depth = 20
+        response = self.post({
+            'output': {'id': '1', 'property': 'children'},
+            'inputs': [{'id': '0', 'property': 'children', 'value': 0}],
+            'chain': True
+        })
+        data = json.loads(response.data)
+        self.assertEqual(len(data['resolved']), 10)
+        self.assertEqual(data['response']['0'], {'children': 10})
+
+    def test_json_engine(self):
+        app = dash.Dash('my-app', json_engine='fast')
+        app.layout = self.app.layout
+        client = app.server.test_client()
+
+        @app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')])
+        def update_output(value):
+            return Div([value, float('nan')], id='child')
+
+        response = client.post(
+            '/_dash-update-component',
+            headers={'Content-Type': 'application/json'},
+            data=json.dumps({
+                'output': {'id': 'output', 'property': 'children'},
+                'inputs': [
+                    {'id': 'input-1', 'property': 'value', 'value': 'a'}
+                ]
+            })
+        )
+        self.assertEqual(
+            json.loads(response.data)['response']['props']['children'],
+            {'namespace': 'dash_html_components', 'type': 'Div',
+             'props': {'children': ['a', None], 'id': 'child'}}
+        )
+
+    def test_no_update(self):
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            memoize=True)
+        def update_output(value):
+            return dash.no_update if value is None else value
+
+        @self.app.callback(
+            [Output('input-2', 'value'), Output('input-2', 'placeholder')],
+            [Input('input-1', 'value')])
+        def update_outputs(value):
+            return value or dash.no_update, dash.no_update
+
+        def request(output, value):
+            return self.post({
+                'output': output,
+                'inputs': [
+                    {'id': 'input-1', 'property': 'value', 'value': value}
+                ]
+            })
+
+        single = {'id': 'output', 'property': 'children'}
+        for _ in range(2):
+            response = request(single, None)
+            self.assertEqual(response.status_code, 204)
+            self.assertEqual(response.data, b'')
+        self.assertEqual(self.app.cache_info()['output.children']['hits'], 1)
+
+        multi = '..input-2.value...input-2.placeholder..'
+        self.assertEqual(request(multi, None).status_code, 204)
+        self.assertEqual(
+            json.loads(request(multi, 'a').data),
+            {'multi': True, 'response': {'input-2': {'value': 'a'}}}
+        )
+
+    def test_single_flight(self):
+        calls = []
+        release = threading.Event()
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            single_flight=True)
+        def update_output(value):
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        responses = []
+
+        def request():
+            responses.append(self.app.server.test_client().post(
+                '/_dash-update-component',
+                headers={'Content-Type': 'application/json'},
+                data=json.dumps({
+                    'output': {'id': 'output', 'property': 'children'},
+                    'inputs': [
+                        {'id': 'input-1', 'property': 'value', 'value': 'a'}
+                    ]
+                })
+            ))
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, ['a'])
+        self.assertEqual(
+            [json.loads(r.data) for r in responses],
+            [{'response': {'props': {'children': 'a'}}}] * 5
+        )
+
+        # Not coalesced once the first call is done.
+        self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [{'id': 'input-1', 'property': 'value', 'value': 'a'}]
+        })
+        self.assertEqual(calls, ['a', 'a'])
+
+    @unittest.skipIf(sys.platform == 'win32', 'no fcntl on Windows')
+    def test_single_flight_lock_dir(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        # Created by the first instance.
+        lock_dir = os.path.join(tmp_dir, 'single-flight')
+
+        # Each instance stands for a worker process.
+        flights = [SingleFlight(lock_dir) for _ in range(3)]
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.3)
+            return u'{"response": "\xe9"}'
+
+        def run(flight):
+            results.append(flight.do('key', compute))
+
+        threads = [threading.Thread(target=run, args=(f,)) for f in flights]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [u'{"response": "\xe9"}'] * 3)
+
+    @unittest.skipIf(sys.platform == 'win32', 'no fcntl on Windows')
+    def test_single_flight_cleanup(self):
+        lock_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, lock_dir)
+        flight = SingleFlight(lock_dir, result_ttl=60)
+
+        flight.do('stale', lambda: '{}')
+        stale = time.time() - 120
+        for name in os.listdir(lock_dir):
+            os.utime(os.path.join(lock_dir, name), (stale, stale))
+
+        flight._last_cleanup = 0
+        flight.do('key', lambda: '{}')
+        self.assertEqual(sorted(os.listdir(lock_dir)),
+                         ['key.lock', 'key.result'])
+
+    def test_warm_callbacks(self):
+        self.app.layout = Div([
+            dcc.Dropdown(
+                id='dropdown',
+                options=[{'label': v, 'value': v} for v in 'abc'],
+                value='a'),
+            dcc.Input(id='input-1', value=1),
+            dcc.Checklist(
+                id='checklist',
+                options=[{'label': v, 'value': v} for v in 'xy'],
+                values=['x']),
+            Div(id='output'),
+            Div(id='output-2')
+        ])
+        calls = []
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('dropdown', 'value')],
+            [State('input-1', 'value'), State('checklist', 'values')],
+            memoize=True)
+        def update_output(value, state, checked):
+            calls.append((value, state, checked))
+            return value
+
+        @self.app.callback(
+            Output('output-2', 'children'),
+            [Input('dropdown', 'value')])
+        def not_memoized(value):
+            calls.append(value)
+            return value
+
+        warmer = self.app.warm_callbacks(max_workers=2)
+        self.assertEqual(warmer.progress()['total'], 0)
+
+        # Started by the setup of the server.
+        self.client.get('/')
+        self.assertTrue(warmer.wait(5))
+        self.assertEqual(
+            warmer.progress(),
+            {'total': 3, 'done': 3, 'failed': 0, 'finished': True}
+        )
+        self.assertEqual(
+            sorted(calls),
+            [('a', 1, ['x']), ('b', 1, ['x']), ('c', 1, ['x'])])
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [{'id': 'dropdown', 'property': 'value', 'value': 'b'}],
+            'state': [
+                {'id': 'input-1', 'property': 'value', 'value': 1},
+                {'id': 'checklist', 'property': 'values', 'value': ['x']}
+            ]
+        })
+        self.assertEqual(
+            json.loads(response.data),
+            {'response': {'props': {'children': 'b'}}}
+        )
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(self.app.cache_info()['output.children']['hits'], 1)
+
+    def test_invalidate(self):
+        calls = []
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            memoize=True,
+            cache_tags=['prices'])
+        def update_output(value):
+            calls.append(value)
+            return value
+
+        def request(value):
+            return self.post({
+                'output': {'id': 'output', 'property': 'children'},
+                'inputs': [
+                    {'id': 'input-1', 'property': 'value', 'value': value}
+                ]
+            })
+
+        request('a')
+        request('b')
+        request('a')
+        self.assertEqual(calls, ['a', 'b'])
+
+        self.app.invalidate(
+            callback=Output('output', 'children'), args=['a'])
+        request('a')
+        request('b')
+        self.assertEqual(calls, ['a', 'b', 'a'])
+
+        self.app.invalidate(tag='prices')
+        request('a')
+        request('b')
+        self.assertEqual(calls, ['a', 'b', 'a', 'a', 'b'])
+
+        self.app.invalidate(tag='other')
+        self.app.invalidate(callback='output.children')
+        request('b')
+        request('b')
+        self.assertEqual(calls, ['a', 'b', 'a', 'a', 'b', 'b'])
+
+        self.app.invalidate(callback=u'output.children')
+        request('b')
+        self.assertEqual(calls, ['a', 'b', 'a', 'a', 'b', 'b', 'b'])
+
+        self.assertRaises(
+            exceptions.UnknownCallback,
+            self.app.invalidate, callback=Output('input-2', 'value'))
+        self.assertRaises(
+            exceptions.IncorrectTypeException,
+            self.app.invalidate, args=['a'])
+
+    def test_invalidate_across_processes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        # Two workers of the same app.
+        apps = [
+            dash.Dash('my-app', cache_invalidation_dir=directory)
+            for _ in range(2)
+        ]
+        calls = []
+        for app in apps:
+            app.layout = self.app.layout
+
+            @app.callback(
+                Output('output', 'children'),
+                [Input('input-1', 'value')],
+                memoize=True,
+                cache_tags=['prices'])
+            def update_output(value):
+                calls.append(value)
+                return value
+
+        callbacks = [app.callback_map['output.children']['callback']
+                     for app in apps]
+        for callback in callbacks:
+            callback('a')
+            callback('a')
+        self.assertEqual(calls, ['a', 'a'])
+
+        apps[0].invalidate(tag='prices')
+        callbacks[1]('a')
+        self.assertEqual(calls, ['a', 'a', 'a'])
+
+    def test_interval(self):
+        calls = []
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')],
+            interval=0.1)
+        def update_output(value):
+            calls.append(value)
+            return len(calls)
+
+        def request(value):
+            return json.loads(self.post({
+                'output': {'id': 'output', 'property': 'children'},
+                'inputs': [
+                    {'id': 'input-1', 'property': 'value', 'value': value}
+                ]
+            }).data)['response']['props']['children']
+
+        # The clients sending the same arguments share the response.
+        self.assertEqual([request('a'), request('a'), request('a')],
+                         [1, 1, 1])
+        self.assertEqual(calls, ['a'])
+
+        # Each tuple of arguments has its own tick.
+        self.assertEqual(request('b'), 2)
+        self.assertEqual(request('a'), 1)
+        self.assertEqual(calls, ['a', 'b'])
+
+        # Computed by the scheduler with the arguments of each tick.
+        time.sleep(0.25)
+        self.assertGreater(request('a'), 2)
+        self.assertGreater(request('b'), 2)
+        self.assertEqual(set(calls[2:]), {'a', 'b'})
+
+        # Stops ticking without requests.
+        time.sleep(0.6)
+        ticks = len(calls)
+        time.sleep(0.3)
+        self.assertEqual(len(calls), ticks)
+
+        self.assertRaises(
+            exceptions.IncorrectTypeException,
+            self.app.callback,
+            Output('input-2', 'value'),
+            [Input('input-1', 'value')],
+            interval=1, memoize=True)
+
+    def test_raw_json_response(self):
+        figure = dash.RawJSON.from_object({'data': [{'y': [1, 2]}]})
+
+        @self.app.callback(
+            Output('output', 'children'),
+            [Input('input-1', 'value')])
+        def update_output(value):
+            return figure
+
+        response = self.post({
+            'output': {'id': 'output', 'property': 'children'},
+            'inputs': [{'id': 'input-1', 'property': 'value', 'value': 1}]
+        })
+        self.assertEqual(
+            json.loads(response.data),
+            {'response': {'props': {'children': {'data': [{'y': [1, 2]}]}}}}
+        )
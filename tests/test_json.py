@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import datetime
+import decimal
+import json
+import sys
+import unittest
+
+import plotly
+from dash_html_components import Div
+
+import dash
+from dash import _json
+from dash import exceptions
+
+try:
+    import numpy
+    import pandas
+except ImportError:
+    numpy = pandas = None
+
+
+class TestJSONEngines(unittest.TestCase):
+    def setUp(self):
+        self.plotly = _json.PlotlyJSONEngine()
+        self.fast = _json.FastJSONEngine()
+
+    def assertSameJSON(self, output, expected):
+        if sys.version_info < (3,):
+            # The round trip of `PlotlyJSONEncoder` loses the order of the
+            # keys on Python 2.
+            self.assertEqual(json.loads(output), json.loads(expected))
+        else:
+            self.assertEqual(output, expected)
+
+    def assertSameOutput(self, obj):
+        expected = json.dumps(obj, cls=plotly.utils.PlotlyJSONEncoder)
+        self.assertSameJSON(self.fast.dumps(obj), expected)
+        self.assertSameJSON(
+            ''.join(_json.iterencode(obj, chunk_size=7)), expected)
+
+    def test_builtins(self):
+        self.assertSameOutput({
+            'a': [1, 2.5, -3e100, None, True, u'é', 'str'],
+            1: {'nested': (1, 2)},
+        })
+
+    def test_components(self):
+        self.assertSameOutput(Div([
+            Div('text', id='a', style={'color': 'red'}),
+            Div([Div(1.5), 'b'], **{'data-x': 1})
+        ], id='root'))
+
+    def test_nan_and_infinity(self):
+        self.assertSameOutput([float('nan'), float('inf'), -float('inf')])
+        self.assertEqual(
+            self.fast.dumps([float('nan')]),
+            '[null]'
+        )
+
+    def test_exotic_types(self):
+        self.assertSameOutput([
+            datetime.datetime(2019, 1, 2, 3, 4, 5),
+            datetime.date(2019, 1, 2),
+            decimal.Decimal('1.5'),
+        ])
+
+    @unittest.skipIf(numpy is None, 'requires numpy and pandas')
+    def test_numpy_and_pandas(self):
+        self.assertSameOutput({
+            'array': numpy.arange(6).reshape(2, 3),
+            'floats': numpy.array([0.1, numpy.nan, 3]),
+            'scalar': numpy.int64(4),
+            'masked': numpy.ma.masked_array([1, 2], mask=[0, 1]),
+            'series': pandas.Series([1.5, 2.5]),
+            'dates': pandas.Series(pandas.date_range('2019-01-01', periods=2)),
+            'nat': pandas.NaT,
+        })
+
+    def test_get_engine(self):
+        self.assertIsInstance(_json.get_engine('fast'), _json.FastJSONEngine)
+        engine = _json.PlotlyJSONEngine()
+        self.assertIs(_json.get_engine(engine), engine)
+        self.assertRaises(exceptions.InvalidConfig, _json.get_engine, 'nope')
+
+    def test_raw_json(self):
+        data = {'x': [1, 2, 3], 'y': [float('nan'), 2.5, None]}
+        raw = dash.RawJSON.from_object(data)
+        self.assertEqual(raw.text, self.plotly.dumps(data))
+        self.assertEqual(dash.RawJSON(b'[1, 2]').text, '[1, 2]')
+
+        layout = Div([
+            Div(id='graph', **{'data-figure': raw}),
+            '__dash_raw_json_not_a_placeholder__',
+            Div(dash.RawJSON('{"a":1}'))
+        ])
+        expected = json.dumps(Div([
+            Div(id='graph', **{'data-figure': data}),
+            '__dash_raw_json_not_a_placeholder__',
+            Div({'a': 1})
+        ]), cls=plotly.utils.PlotlyJSONEncoder).replace(
+            '{"a": 1}', '{"a":1}')
+
+        self.assertEqual(self.plotly.dumps(layout), expected)
+        self.assertSameJSON(self.fast.dumps(layout), expected)
+        self.assertSameJSON(
+            ''.join(_json.iterencode(layout, chunk_size=7)), expected)
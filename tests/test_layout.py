@@ -0,0 +1,205 @@
+import gzip
+import io
+import json
+import sys
+import time
+import unittest
+
+import flask
+import plotly
+from dash_html_components import Div
+
+import dash
+from dash.dependencies import Input, Output
+from dash.lazy import Lazy
+
+
+class TestServeLayout(unittest.TestCase):
+    def setUp(self):
+        self.app = dash.Dash('my-app')
+        self.app.layout = Div(
+            [Div('item {}'.format(i), id='item-{}'.format(i))
+             for i in range(100)],
+            id='body')
+        self.app.server.testing = True
+        self.client = self.app.server.test_client()
+
+    def get(self, **headers):
+        return self.client.get('/_dash-layout', headers=headers)
+
+    def expected(self):
+        return json.loads(json.dumps(
+            self.app.layout, cls=plotly.utils.PlotlyJSONEncoder))
+
+    def test_static_layout_etag(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data), self.expected())
+        etag = response.headers['ETag']
+
+        response = self.get(**{'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+        # Invalidated by the assignment of the layout.
+        self.app.layout = Div('new', id='body')
+        response = self.get(**{'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(json.loads(response.data), self.expected())
+
+    def test_static_layout_gzip(self):
+        response = self.get(**{'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        data = gzip.GzipFile(fileobj=io.BytesIO(response.data)).read()
+        self.assertEqual(json.loads(data.decode('utf-8')), self.expected())
+
+        identity = self.get()
+        self.assertNotEqual(
+            response.headers['ETag'], identity.headers['ETag'])
+
+        response = self.get(**{
+            'Accept-Encoding': 'gzip',
+            'If-None-Match': response.headers['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+    def test_function_layout(self):
+        calls = []
+
+        def layout():
+            calls.append(1)
+            return Div(len(calls), id='body')
+
+        self.app.layout = layout
+        self.get()
+        response = self.get()
+        self.assertNotIn('ETag', response.headers)
+        self.assertEqual(
+            json.loads(response.data)['props']['children'], len(calls))
+
+    def test_streamed_layout(self):
+        app = dash.Dash('my-app', stream_layout=True)
+        app.layout = lambda: self.app.layout
+        client = app.server.test_client()
+
+        response = client.get('/_dash-layout')
+        self.assertTrue(response.is_streamed)
+        expected = json.dumps(
+            self.app.layout, cls=plotly.utils.PlotlyJSONEncoder)
+        if sys.version_info < (3,):
+            # The keys of `PlotlyJSONEncoder` are reordered on Python 2.
+            self.assertEqual(json.loads(response.data.decode('utf-8')),
+                             json.loads(expected))
+        else:
+            self.assertEqual(response.data.decode('utf-8'), expected)
+
+        response = client.get(
+            '/_dash-layout', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        data = gzip.GzipFile(fileobj=io.BytesIO(response.data)).read()
+        self.assertEqual(json.loads(data.decode('utf-8')), self.expected())
+
+    def test_cached_layout(self):
+        calls = []
+
+        def layout():
+            user = flask.request.headers.get('X-User') \
+                if flask.has_request_context() else None
+            calls.append(user)
+            return Div(user, id='body')
+
+        self.app.layout = dash.caching.CachedLayout(
+            layout, ttl=0.2, key=lambda: flask.request.headers.get('X-User'))
+        # Called by the assignment and the validation of the first request.
+        self.client.get('/')
+        del calls[:]
+
+        def get(user):
+            response = self.get(**{'X-User': user})
+            self.assertEqual(
+                json.loads(response.data)['props']['children'], user)
+            return response
+
+        etag = get('a').headers['ETag']
+        get('a')
+        get('b')
+        self.assertEqual(calls, ['a', 'b'])
+        self.assertEqual(
+            self.get(**{'X-User': 'a', 'If-None-Match': etag}).status_code,
+            304)
+
+        time.sleep(0.3)
+        get('a')
+        self.assertEqual(calls, ['a', 'b', 'a'])
+
+    def test_cached_layout_max_size(self):
+        calls = []
+
+        def layout():
+            calls.append(1)
+            return Div('x' * 100, id='body')
+
+        cached = dash.caching.CachedLayout(
+            layout, key=lambda: flask.request.args.get('page'), max_size=300)
+        self.app.layout = cached
+        self.client.get('/')
+        del calls[:]
+        for page in range(5):
+            self.client.get('/_dash-layout?page={}'.format(page))
+        self.assertEqual(len(calls), 5)
+        self.assertLessEqual(cached.cache.info()['size'], 300)
+        self.assertEqual(cached.cache.info()['evictions'], 4)
+
+    def test_cached_layout_counts_compressed_variants(self):
+        cached = dash.caching.CachedLayout(
+            lambda: Div(['item {}'.format(i) for i in range(100)], id='body'))
+        self.app.layout = cached
+        self.client.get('/_dash-layout')
+
+        serialized = cached.cache.get(None)
+        self.assertGreater(len(serialized), len(serialized.body))
+        self.assertEqual(cached.cache.info()['size'], len(serialized))
+        self.assertFalse(hasattr(serialized, 'layout'))
+
+
+class TestLazy(unittest.TestCase):
+    def setUp(self):
+        self.app = dash.Dash('my-app')
+        self.app.layout = Div([
+            Div(id='input'),
+            Lazy(Div([Div('tab content', id='inner')], id='tab'))
+        ], id='body')
+        self.client = self.app.server.test_client()
+
+    def test_children_left_out_of_layout(self):
+        layout = json.loads(self.client.get('/_dash-layout').data)
+        self.assertEqual(
+            layout['props']['children'][1],
+            {'props': {'id': 'tab'}, 'type': 'Div',
+             'namespace': 'dash_html_components', 'lazy': True}
+        )
+
+        response = self.client.get('/_dash-layout-subtree/tab')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.data),
+            [{'props': {'children': 'tab content', 'id': 'inner'},
+              'type': 'Div', 'namespace': 'dash_html_components'}]
+        )
+
+        self.assertEqual(
+            self.client.get('/_dash-layout-subtree/inner').status_code, 404)
+
+    def test_callbacks_target_lazy_children(self):
+        @self.app.callback(Output('inner', 'children'),
+                           [Input('input', 'children')])
+        def update(value):
+            return value
+
+        self.assertIn('inner.children', self.app.callback_map)
+
+    def test_container_needs_an_id(self):
+        self.assertRaises(TypeError, Lazy, Div('no id'))